@@ -12,15 +12,22 @@ Usage:
 """
 
 import argparse
+import functools
 import hashlib
 import os
 import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 
+# PyInstaller work directory, kept between builds so Analysis results are reused
+PYI_WORK_DIR = Path("build/pyi-cache")
 
+
+@functools.lru_cache(maxsize=1)
 def get_version():
     """Get version from git tags or employee_manager module."""
     try:
@@ -48,6 +55,93 @@ def get_version():
     return "0.0.0"
 
 
+def compute_sha256(path):
+    """Compute the SHA256 checksum of a file.
+
+    Uses hashlib.file_digest, which reads in large blocks and hashes
+    outside the GIL through OpenSSL's accelerated implementation.
+
+    Args:
+        path: Path to the file to hash
+
+    Returns:
+        Hex digest string
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def hash_artifact(path):
+    """Hash a single artifact and read its size.
+
+    Args:
+        path: Path to the artifact
+
+    Returns:
+        Tuple of (path, checksum, size_bytes)
+    """
+    return path, compute_sha256(path), path.stat().st_size
+
+
+def compute_build_signature():
+    """Compute a signature of the inputs that affect PyInstaller Analysis.
+
+    Combines the contents of pyproject.toml and uv.lock with the
+    modification times of every source file under src/.
+
+    Returns:
+        Hex digest string
+    """
+    signature = hashlib.sha256()
+    for input_file in (Path("pyproject.toml"), Path("uv.lock")):
+        if input_file.exists():
+            signature.update(input_file.read_bytes())
+    for source_file in sorted(Path("src").rglob("*.py")):
+        signature.update(f"{source_file}:{source_file.stat().st_mtime_ns}\n".encode())
+    return signature.hexdigest()
+
+
+def pyinstaller_signature_file(spec_file):
+    """Return where the input signature of a spec's last build is stored.
+
+    Args:
+        spec_file: Path to the .spec file
+
+    Returns:
+        Path to the signature file
+    """
+    return PYI_WORK_DIR / f"{spec_file.stem}.sig"
+
+
+def pyinstaller_cache_is_fresh(spec_file, signature):
+    """Check whether a spec's PyInstaller work directory matches the current inputs.
+
+    PyInstaller keeps each spec's Analysis in its own subdirectory of the
+    work path, so both that directory and the spec's signature must match.
+
+    Args:
+        spec_file: Path to the .spec file
+        signature: Signature returned by compute_build_signature()
+
+    Returns:
+        True if the cached Analysis can be reused
+    """
+    signature_file = pyinstaller_signature_file(spec_file)
+    if not signature_file.exists() or not (PYI_WORK_DIR / spec_file.stem).is_dir():
+        return False
+    return signature_file.read_text().strip() == signature
+
+
+def write_lines(lines):
+    """Write a group of output lines to stdout in a single call.
+
+    Args:
+        lines: List of lines without trailing newlines
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 def run_command(cmd, cwd=None, check=True):
     """Run a command and display output.
 
@@ -67,59 +161,150 @@ def run_command(cmd, cwd=None, check=True):
     return result
 
 
+def _walk_python_cache(root):
+    """Walk a directory tree once, yielding Python cache entries.
+
+    Uses os.scandir so entry types come from the directory listing instead
+    of a stat call per file. __pycache__ directories are yielded but not
+    descended into.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        Tuples of (DirEntry, is_pycache, is_pyc)
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name == "__pycache__":
+                    yield entry, True, False
+                else:
+                    yield from _walk_python_cache(entry.path)
+            elif entry.name.endswith(".pyc"):
+                yield entry, False, True
+
+
 def clean_build():
     """Clean build artifacts."""
-    print("Cleaning build artifacts...")
-    dirs_to_clean = ["build", "dist", "__pycache__", "*.spec"]
-
-    for dir_name in dirs_to_clean:
-        if dir_name.endswith("*"):
-            # Clean spec files in root
-            for spec_file in Path(".").glob("*.spec"):
-                if spec_file.name not in ["wems.spec", "wems-cli.spec"]:
-                    spec_file.unlink()
-                    print(f"  Removed: {spec_file}")
-        else:
-            dir_path = Path(dir_name)
-            if dir_path.exists():
-                shutil.rmtree(dir_path)
-                print(f"  Removed: {dir_name}")
-
-    # Clean Python cache
-    for pycache in Path(".").rglob("__pycache__"):
-        if pycache.is_dir():
-            shutil.rmtree(pycache)
-
-    # Clean .pyc files
-    for pyc_file in Path(".").rglob("*.pyc"):
-        pyc_file.unlink()
-
-
-def run_tests():
-    """Run tests before building."""
-    print("\nRunning tests...")
-    run_command(["uv", "run", "pytest", "tests/", "-v", "--tb=short",
-                 "--ignore=tests/test_ui", "--ignore=tests/test_main_window.py"])
+    lines = ["Cleaning build artifacts..."]
+
+    # Build output directories
+    for dir_path in (PYI_WORK_DIR, Path("dist")):
+        if dir_path.exists():
+            shutil.rmtree(dir_path)
+            lines.append(f"  Removed: {dir_path}")
+
+    # Generated spec files in root
+    for spec_file in Path(".").glob("*.spec"):
+        if spec_file.name not in ["wems.spec", "wems-cli.spec", "wareflow-ems.spec"]:
+            spec_file.unlink()
+            lines.append(f"  Removed: {spec_file}")
+
+    # Clean Python cache and stray .pyc files in a single tree walk.
+    # The walk never descends into __pycache__, so only outermost cache
+    # directories are collected and each is removed exactly once.
+    pycache_dirs = []
+    for entry, is_pycache, is_pyc in _walk_python_cache("."):
+        if is_pycache:
+            pycache_dirs.append(entry.path)
+        elif is_pyc:
+            os.unlink(entry.path)
+
+    for pycache in pycache_dirs:
+        shutil.rmtree(pycache, ignore_errors=True)
+
+    write_lines(lines)
+
+
+TEST_COMMAND = ["uv", "run", "pytest", "tests/", "-v", "--tb=short",
+                "--ignore=tests/test_ui", "--ignore=tests/test_main_window.py"]
+
+
+def start_tests():
+    """Start the test suite in the background.
+
+    Output is captured to a temporary file so it does not interleave with
+    the PyInstaller log; it is replayed by wait_for_tests().
+
+    Returns:
+        Tuple of (process, log file)
+    """
+    print(f"\n> Running in background: {' '.join(TEST_COMMAND)}")
+    log_file = tempfile.TemporaryFile()
+    process = subprocess.Popen(TEST_COMMAND, stdout=log_file, stderr=subprocess.STDOUT)
+    return process, log_file
+
+
+def wait_for_tests(process, log_file):
+    """Wait for background tests, replay their output and fail on error.
+
+    Args:
+        process: Process returned by start_tests()
+        log_file: Log file returned by start_tests()
+    """
+    returncode = process.wait()
+    with log_file:
+        log_file.seek(0)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(log_file.read())
+        sys.stdout.buffer.flush()
+    if returncode != 0:
+        print(f"Tests failed with exit code {returncode}")
+        sys.exit(1)
+
+
+def get_commit_date():
+    """Get the committer date of HEAD as an ISO 8601 string.
+
+    Using the commit date keeps rebuilds of the same revision byte-identical.
+    Falls back to the current UTC time when git is unavailable.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "log", "-1", "--format=%cI"],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    except Exception:
+        pass
+
+    return datetime.now(timezone.utc).isoformat()
 
 
 def inject_version(version):
     """Inject version into the application before building.
 
+    The file is left untouched when it already holds the same version and
+    build type, so PyInstaller's bytecode cache stays valid across rebuilds.
+
     Args:
         version: Version string to inject
     """
     print(f"\nInjecting version: {version}")
 
-    # Create version file
     version_file = Path("src/version_info.py")
+    build_type = "standalone"
+
+    if version_file.exists():
+        existing = version_file.read_text()
+        if (f'__version__ = "{version}"' in existing
+                and f'__build_type__ = "{build_type}"' in existing):
+            print(f"  Unchanged: {version_file}")
+            return
+
+    # Create version file
     version_content = f'''"""Version information for Wareflow EMS.
 
 This file is auto-generated during the build process.
 """
 
 __version__ = "{version}"
-__build_date__ = "{datetime.now(timezone.utc).isoformat()}"
-__build_type__ = "standalone"
+__build_date__ = "{get_commit_date()}"
+__build_type__ = "{build_type}"
 '''
 
     version_file.write_text(version_content)
@@ -136,7 +321,7 @@ def build_executable(build_type="gui", version=None, clean=False, skip_tests=Fal
         skip_tests: Whether to skip tests
 
     Returns:
-        List of (artifact_path, checksum) tuples
+        List of (artifact_path, checksum, size_bytes) tuples
     """
     version = version or get_version()
     build_name = "wems" if build_type == "gui" else "wems-cli"
@@ -147,20 +332,36 @@ def build_executable(build_type="gui", version=None, clean=False, skip_tests=Fal
     if clean:
         clean_build()
 
-    # Inject version
-    inject_version(version)
-
-    # Run tests first
-    if not skip_tests:
-        run_tests()
-
     # Check if spec file exists
     if not spec_file.exists():
         print(f"Error: Spec file not found: {spec_file}")
         sys.exit(1)
 
-    # Build with PyInstaller
-    run_command(["uv", "run", "pyinstaller", str(spec_file), "--clean", "--noconfirm"])
+    # Run tests alongside the build; they do not depend on the version file
+    tests = None if skip_tests else start_tests()
+
+    # Inject version
+    inject_version(version)
+
+    # Build with PyInstaller, reusing the work directory unless inputs changed
+    signature = compute_build_signature()
+    pyinstaller_cmd = [
+        "uv", "run", "pyinstaller", str(spec_file),
+        "--workpath", str(PYI_WORK_DIR),
+        "--distpath", "dist",
+        "--noconfirm",
+    ]
+    if clean or not pyinstaller_cache_is_fresh(spec_file, signature):
+        pyinstaller_cmd.append("--clean")
+    try:
+        run_command(pyinstaller_cmd)
+    finally:
+        if tests:
+            wait_for_tests(*tests)
+    # Only reached when this spec built successfully
+    signature_file = pyinstaller_signature_file(spec_file)
+    signature_file.parent.mkdir(parents=True, exist_ok=True)
+    signature_file.write_text(signature)
 
     # Generate checksums
     print("\nGenerating checksums...")
@@ -181,47 +382,44 @@ def build_executable(build_type="gui", version=None, clean=False, skip_tests=Fal
         print(f"Warning: No executable found matching pattern: {exe_pattern}")
         return []
 
-    for exe_file in exe_files:
-        # Calculate SHA256 checksum
-        sha256_hash = hashlib.sha256()
-        with open(exe_file, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+    # Hash executables concurrently; file_digest releases the GIL
+    with ThreadPoolExecutor(max_workers=min(len(exe_files), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(hash_artifact, exe_file) for exe_file in exe_files]
+        hashed = [future.result() for future in as_completed(futures)]
 
-        checksum = sha256_hash.hexdigest()
+    lines = []
+    for exe_file, checksum, file_size in sorted(hashed):
         checksum_file = dist_dir / f"{exe_file.name}.sha256"
 
-        with open(checksum_file, "w") as f:
-            f.write(f"{checksum}  {exe_file.name}\n")
+        checksum_file.write_bytes(f"{checksum}  {exe_file.name}\n".encode())
 
-        # Get file size
-        file_size = exe_file.stat().st_size
         file_size_mb = file_size / (1024 * 1024)
 
-        print(f"  {exe_file.name}: {checksum}")
-        print(f"    Size: {file_size_mb:.2f} MB")
-        artifacts.append((exe_file, checksum))
+        lines.append(f"  {exe_file.name}: {checksum}")
+        lines.append(f"    Size: {file_size_mb:.2f} MB")
+        artifacts.append((exe_file, checksum, file_size))
 
     # Create version.txt file
     version_file = dist_dir / f"{build_name}-version.txt"
-    with open(version_file, "w") as f:
-        f.write(f"Wareflow Employee Management System\n")
-        f.write(f"Version: {version}\n")
-        f.write(f"Build Type: {build_type.upper()}\n")
-        f.write(f"Build Date: {datetime.now(timezone.utc).isoformat()}\n")
-        f.write(f"Platform: {sys.platform}\n")
-        f.write(f"Python: {sys.version.split()[0]}\n")
-
-    artifacts.append((version_file, None))
-
-    print(f"\n[OK] {build_name.upper()} build complete!")
-    print(f"\nArtifacts created in dist/{build_name}/:")
-    for artifact, checksum in artifacts:
+    version_content = (
+        f"Wareflow Employee Management System\n"
+        f"Version: {version}\n"
+        f"Build Type: {build_type.upper()}\n"
+        f"Build Date: {datetime.now(timezone.utc).isoformat()}\n"
+        f"Platform: {sys.platform}\n"
+        f"Python: {sys.version.split()[0]}\n"
+    ).encode()
+    version_file.write_bytes(version_content)
+
+    artifacts.append((version_file, None, len(version_content)))
+
+    lines.append(f"\n[OK] {build_name.upper()} build complete!")
+    lines.append(f"\nArtifacts created in dist/{build_name}/:")
+    for artifact, checksum, _size in artifacts:
+        lines.append(f"  - {artifact.name}")
         if checksum:
-            print(f"  - {artifact.name}")
-            print(f"    SHA256: {checksum}")
-        else:
-            print(f"  - {artifact.name}")
+            lines.append(f"    SHA256: {checksum}")
+    write_lines(lines)
 
     return artifacts
 
@@ -238,6 +436,7 @@ def build_all(version=None, clean=False, skip_tests=False):
         Combined list of artifacts from both builds
     """
     all_artifacts = []
+    version = version or get_version()
 
     # Build GUI version
     gui_artifacts = build_executable("gui", version, clean, skip_tests)
@@ -259,26 +458,23 @@ def print_summary(artifacts):
     """Print build summary.
 
     Args:
-        artifacts: List of (artifact_path, checksum) tuples
+        artifacts: List of (artifact_path, checksum, size_bytes) tuples
     """
-    print("\n" + "="*60)
-    print("BUILD SUMMARY")
-    print("="*60)
+    lines = ["\n" + "="*60, "BUILD SUMMARY", "="*60]
 
     total_size = 0
-    for artifact, checksum in artifacts:
-        if artifact.is_file():
-            size = artifact.stat().st_size
-            total_size += size
-            size_mb = size / (1024 * 1024)
-            print(f"\n{artifact.name}")
-            print(f"  Location: {artifact}")
-            print(f"  Size: {size_mb:.2f} MB")
-            if checksum:
-                print(f"  SHA256: {checksum}")
-
-    print(f"\nTotal size: {total_size / (1024 * 1024):.2f} MB")
-    print("\n[OK] All builds completed successfully!")
+    for artifact, checksum, size in artifacts:
+        total_size += size
+        size_mb = size / (1024 * 1024)
+        lines.append(f"\n{artifact.name}")
+        lines.append(f"  Location: {artifact}")
+        lines.append(f"  Size: {size_mb:.2f} MB")
+        if checksum:
+            lines.append(f"  SHA256: {checksum}")
+
+    lines.append(f"\nTotal size: {total_size / (1024 * 1024):.2f} MB")
+    lines.append("\n[OK] All builds completed successfully!")
+    write_lines(lines)
 
 
 def main():
@@ -8,9 +8,54 @@ Run this script to generate icon files for different platforms:
 """
 
 from PIL import Image, ImageDraw, ImageFont
+import functools
 import os
+import sys
 from pathlib import Path
 
+# Bold font used for the logo, resolved once per platform
+if os.name == 'nt':  # Windows
+    FONT_PATH = "arialbd.ttf"
+elif os.name == 'posix':  # macOS/Linux
+    FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+else:
+    FONT_PATH = None
+
+
+@functools.lru_cache(maxsize=None)
+def load_font(path, size):
+    """Load a TrueType font once per (path, size), falling back to default.
+
+    Args:
+        path: Font file path, or None for the default font
+        size: Font size in pixels
+
+    Returns:
+        PIL font object
+    """
+    if path is None:
+        return ImageFont.load_default()
+    try:
+        return ImageFont.truetype(path, size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=None)
+def text_bbox(text, path, size):
+    """Measure text once per (text, path, size).
+
+    Args:
+        text: Text to measure
+        path: Font file path, or None for the default font
+        size: Font size in pixels
+
+    Returns:
+        Bounding box tuple (left, top, right, bottom)
+    """
+    font = load_font(path, size)
+    return ImageDraw.Draw(Image.new('RGB', (1, 1))).textbbox((0, 0), text, font=font)
+
 
 def create_icon(size=256, bg_color=(41, 98, 255), text_color=(255, 255, 255)):
     """Create a simple icon with W logo.
@@ -36,23 +81,14 @@ def create_icon(size=256, bg_color=(41, 98, 255), text_color=(255, 255, 255)):
         width=size // 32
     )
 
-    # Try to use a nice font, fallback to default
-    try:
-        # Try to find a bold font
-        font_size = int(size * 0.5)
-        if os.name == 'nt':  # Windows
-            font = ImageFont.truetype("arialbd.ttf", font_size)
-        elif os.name == 'posix':  # macOS/Linux
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
-        else:
-            font = ImageFont.load_default()
-    except Exception:
-        font = ImageFont.load_default()
+    # Try to use a nice bold font, fallback to default
+    font_size = int(size * 0.5)
+    font = load_font(FONT_PATH, font_size)
 
     # Draw "W" text
     text = "W"
     # Get text bounding box
-    bbox = draw.textbbox((0, 0), text, font=font)
+    bbox = text_bbox(text, FONT_PATH, font_size)
     text_width = bbox[2] - bbox[0]
     text_height = bbox[3] - bbox[1]
 
@@ -73,14 +109,27 @@ def save_icon(img, output_path, format="ICO", sizes=None):
         output_path: Output file path
         format: Image format (ICO, PNG)
         sizes: List of sizes for ICO format
+
+    Returns:
+        Path of the file actually written
     """
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     if format == "ICO":
         # ICO format with multiple sizes
-        sizes = sizes or [16, 32, 48, 64, 128, 256]
-        img.save(output_path, format='ICO', sizes=[(s, s) for s in sizes])
+        # Pre-render each frame with Lanczos so Pillow embeds them as-is
+        sizes = sorted(sizes or [16, 32, 48, 64, 128, 256], reverse=True)
+        frames = [
+            img if s == img.width else img.resize((s, s), Image.Resampling.LANCZOS)
+            for s in sizes
+        ]
+        frames[0].save(
+            output_path,
+            format='ICO',
+            sizes=[(s, s) for s in sizes],
+            append_images=frames[1:]
+        )
     elif format == "PNG":
         img.save(output_path, format='PNG')
     elif format == "ICNS":
@@ -90,13 +139,12 @@ def save_icon(img, output_path, format="ICO", sizes=None):
         except Exception as e:
             print(f"Warning: Could not create ICNS file: {e}")
             # Fallback to PNG
-            png_path = output_path.with_suffix('.png')
-            img.save(png_path, format='PNG')
-            print(f"  Created PNG instead: {png_path}")
+            output_path = output_path.with_suffix('.png')
+            img.save(output_path, format='PNG')
     else:
         img.save(output_path, format=format)
 
-    print(f"Created: {output_path}")
+    return output_path
 
 
 def main():
@@ -106,39 +154,47 @@ def main():
 
     print("Creating Wareflow EMS icons...")
 
-    # Create base icon
-    base_icon = create_icon(size=256)
+    # Render once at the largest size; smaller icons are downsampled from it
+    sizes = [16, 32, 48, 64, 128, 256, 512]
+    master_icon = create_icon(size=max(sizes))
+    base_icon = master_icon.resize((256, 256), Image.Resampling.LANCZOS)
 
     # Windows ICO
     print("\n1. Creating Windows ICO icon...")
-    save_icon(base_icon, assets_dir / "icon.ico", format="ICO")
+    print(f"Created: {save_icon(base_icon, assets_dir / 'icon.ico', format='ICO')}")
 
     # PNG (for documentation and web)
     print("\n2. Creating PNG icon...")
-    save_icon(base_icon, assets_dir / "icon.png", format="PNG")
+    print(f"Created: {save_icon(base_icon, assets_dir / 'icon.png', format='PNG')}")
 
     # Create multiple sizes for different uses
-    sizes = [16, 32, 48, 64, 128, 256, 512]
     print(f"\n3. Creating additional PNG sizes: {sizes}")
+    lines = []
     for size in sizes:
-        icon = create_icon(size=size)
-        save_icon(icon, assets_dir / f"icon_{size}x{size}.png", format="PNG")
+        if size == master_icon.width:
+            icon = master_icon
+        else:
+            icon = master_icon.resize((size, size), Image.Resampling.LANCZOS)
+        created = save_icon(icon, assets_dir / f"icon_{size}x{size}.png", format="PNG")
+        lines.append(f"Created: {created}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     # macOS ICNS (if supported)
     print("\n4. Creating macOS ICNS icon...")
     try:
-        save_icon(base_icon, assets_dir / "icon.icns", format="ICNS")
+        print(f"Created: {save_icon(base_icon, assets_dir / 'icon.icns', format='ICNS')}")
     except Exception as e:
         print(f"  ICNS creation not supported: {e}")
         print("  Skipping ICNS (macOS users can use icon.png)")
 
     print("\n✅ Icon creation complete!")
     print(f"\nIcons saved to: {assets_dir.absolute()}")
-    print("\nGenerated files:")
+    lines = ["\nGenerated files:"]
     for f in sorted(assets_dir.glob("*")):
         if f.is_file():
             size_kb = f.stat().st_size / 1024
-            print(f"  - {f.name} ({size_kb:.1f} KB)")
+            lines.append(f"  - {f.name} ({size_kb:.1f} KB)")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
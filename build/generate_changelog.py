@@ -10,12 +10,39 @@ Usage:
 """
 
 import argparse
+import functools
+import hashlib
 import re
 import subprocess
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict
 
+# Conventional commit pattern: type(scope)!: description
+# Examples:
+# feat: add new feature
+# fix(auth): resolve login issue
+# feat(database)!: breaking change
+COMMIT_PATTERN = re.compile(r"^(\w+)(?:\(([^)]+)\))?(!)?: (.+)")
+
+# Commit type -> (changelog section, emoji)
+TYPE_MAPPING = {
+    "feat": ("Added", "✨"),
+    "fix": ("Fixed", "🐛"),
+    "security": ("Security", "🔒"),
+    "docs": ("Documentation", "📚"),
+    "refactor": ("Changed", "♻️"),
+    "perf": ("Performance", "⚡"),
+    "test": ("Tests", "✅"),
+    "chore": ("Other", "🔧"),
+    "style": ("Style", "💄"),
+    "build": ("Build", "📦"),
+    "ci": ("CI", "🤖"),
+}
+
+# Records the commit range and version last written to CHANGELOG.md
+CHANGELOG_CACHE = Path(".changelog.cache")
+
 
 def run_git_command(cmd: List[str]) -> str:
     """Run a git command and return output."""
@@ -30,16 +57,14 @@ def run_git_command(cmd: List[str]) -> str:
     return result.stdout.strip()
 
 
+@functools.lru_cache(maxsize=1)
 def get_tags() -> List[str]:
     """Get all git tags sorted by version."""
-    tags = run_git_command(["git", "tag", "-l", "v*.*.*"]).split("\n")
-    # Filter empty strings
-    tags = [t for t in tags if t]
-    # Sort by version
-    tags.sort(key=lambda x: [int(i) for i in x.replace("v", "").split(".")])
-    return tags
+    # git sorts version-aware, so no parsing is needed here
+    return run_git_command(["git", "tag", "-l", "v*.*.*", "--sort=v:refname"]).splitlines()
 
 
+@functools.lru_cache(maxsize=1)
 def get_latest_tag() -> str:
     """Get the latest git tag."""
     tags = get_tags()
@@ -50,38 +75,56 @@ def get_latest_tag() -> str:
 
 def get_commits(from_ref: str = None, to_ref: str = "HEAD") -> List[Dict]:
     """Get commits between two references."""
+    if from_ref and from_ref == to_ref:
+        return []
+
     if from_ref:
         range_spec = f"{from_ref}..{to_ref}"
     else:
         range_spec = to_ref
 
-    # Get commit messages in format: hash|message
-    output = run_git_command([
+    # Stream commit messages in format: hash|message
+    cmd = [
         "git", "log", range_spec,
         "--pretty=format:%H|%s",
         "--reverse"
-    ])
+    ]
 
     commits = []
-    for line in output.split("\n"):
-        if not line or "|" not in line:
-            continue
-        hash_id, message = line.split("|", 1)
-        commits.append({"hash": hash_id, "message": message})
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        bufsize=1
+    ) as proc:
+        for line in proc.stdout:
+            hash_id, sep, message = line.rstrip("\n").partition("|")
+            if not sep:
+                continue
+            commits.append({"hash": hash_id, "message": message})
+
+    if proc.returncode != 0:
+        return []
 
     return commits
 
 
+def get_range_signature(from_ref: str = None, to_ref: str = "HEAD") -> str:
+    """Get a signature identifying the commits between two references.
+
+    Returns an empty string if git cannot resolve the range.
+    """
+    range_spec = f"{from_ref}..{to_ref}" if from_ref else to_ref
+    output = run_git_command(["git", "rev-parse", range_spec])
+    if not output:
+        return ""
+    return hashlib.sha256(output.encode()).hexdigest()
+
+
 def parse_commit_message(message: str) -> Dict:
     """Parse a conventional commit message."""
-    # Pattern: type(scope): description
-    # Examples:
-    # feat: add new feature
-    # fix(auth): resolve login issue
-    # feat(database)!: breaking change
-    pattern = r"^(\w+)(?:\(([^)]+)\))?(!)?: (.+)"
-
-    match = re.match(pattern, message)
+    match = COMMIT_PATTERN.match(message)
     if not match:
         return {"type": "other", "scope": None, "breaking": False, "description": message}
 
@@ -97,27 +140,9 @@ def parse_commit_message(message: str) -> Dict:
 
 def categorize_commit(parsed: Dict) -> tuple:
     """Categorize commit into changelog section and emoji."""
-    type_mapping = {
-        "feat": ("Added", "✨"),
-        "fix": ("Fixed", "🐛"),
-        "security": ("Security", "🔒"),
-        "docs": ("Documentation", "📚"),
-        "refactor": ("Changed", "♻️"),
-        "perf": ("Performance", "⚡"),
-        "test": ("Tests", "✅"),
-        "chore": ("Other", "🔧"),
-        "style": ("Style", "💄"),
-        "build": ("Build", "📦"),
-        "ci": ("CI", "🤖"),
-    }
-
-    category, emoji = type_mapping.get(parsed["type"], ("Other", "🔧"))
-
     if parsed["breaking"]:
-        category = "Breaking Changes"
-        emoji = "⚠️"
-
-    return category, emoji
+        return "Breaking Changes", "⚠️"
+    return TYPE_MAPPING.get(parsed["type"], ("Other", "🔧"))
 
 
 def generate_changelog(
@@ -187,26 +212,37 @@ def generate_changelog(
     return changelog
 
 
-def update_changelog_file(version: str = None, from_tag: str = None):
-    """Update CHANGELOG.md file."""
+def update_changelog_file(version: str = None, from_tag: str = None, to_tag: str = "HEAD"):
+    """Update CHANGELOG.md file.
+
+    Skipped when the commit range and version match the last update.
+    """
     changelog_path = Path("CHANGELOG.md")
 
+    signature = get_range_signature(from_tag, to_tag)
+    cache_key = f"{signature}\n{version or 'Unreleased'}"
+    if (signature and changelog_path.exists() and CHANGELOG_CACHE.exists()
+            and CHANGELOG_CACHE.read_text() == cache_key):
+        print(f"✅ {changelog_path} is up to date")
+        return
+
     # Generate new changelog entry
-    new_entry = generate_changelog(version, from_tag)
+    new_entry = generate_changelog(version, from_tag, to_tag)
 
     if changelog_path.exists():
         # Read existing changelog
         content = changelog_path.read_text()
 
         # Check if unreleased section exists
-        if "## [Unreleased]" in content:
-            # Replace unreleased section
-            content = re.sub(
-                r"## \[Unreleased\].*?(?=\n## \[|$)",
-                new_entry,
-                content,
-                flags=re.DOTALL
-            )
+        start = content.find("## [Unreleased]")
+        if start != -1:
+            # Replace unreleased section up to the next version heading
+            end = content.find("\n## [", start + 1)
+            if end == -1:
+                end = len(content)
+                if content.endswith("\n"):
+                    end -= 1
+            content = content[:start] + new_entry + content[end:]
         else:
             # Add new version at top
             content = new_entry + "\n" + content
@@ -224,6 +260,8 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
 
     # Write updated changelog
     changelog_path.write_text(content)
+    if signature:
+        CHANGELOG_CACHE.write_text(cache_key)
 
     print(f"✅ Updated {changelog_path}")
 
@@ -277,14 +315,16 @@ def main():
     if version and not version.startswith("v"):
         version = f"v{version}"
 
+    # Output
+    if args.update_file and not args.output:
+        update_changelog_file(version, from_tag, args.to_tag)
+        return
+
     changelog = generate_changelog(version, from_tag, args.to_tag)
 
-    # Output
     if args.output:
         Path(args.output).write_text(changelog)
         print(f"✅ Changelog written to {args.output}")
-    elif args.update_file:
-        update_changelog_file(version, from_tag)
     else:
         print(changelog)
 
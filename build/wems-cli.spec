@@ -139,6 +139,8 @@ a = Analysis(
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    # Strip asserts only: Typer builds command help from docstrings
+    optimize=1,
 )
 
 # Remove unnecessary files from the executable
@@ -119,6 +119,9 @@ a = Analysis(
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    # Strip asserts only: the bundled cli.update/upgrade/rollback Typer apps
+    # build their command help from docstrings
+    optimize=1,
 )
 
 # Remove unnecessary files from the executable
@@ -10,23 +10,33 @@ from pathlib import Path
 
 sys.path.insert(0, 'src')
 
-from datetime import date
+from datetime import date, datetime
 from employee.models import Caces, Employee
 from database.connection import database, init_database
-from ui_ctk.forms.caces_form import CacesFormDialog
+
+# Import the form once; tests check this sentinel instead of re-importing
+try:
+    from ui_ctk.forms.caces_form import CacesFormDialog
+    _IMPORTS_OK = True
+    _IMPORT_ERROR = None
+except ImportError as e:
+    CacesFormDialog = None
+    _IMPORTS_OK = False
+    _IMPORT_ERROR = e
+
+REQUIRED_FORM_METHODS = {"validate", "save", "parse_date"}
 
 
 def test_caces_form_imports():
     """Test that CacesFormDialog imports correctly."""
     print("[TEST 1] Testing CacesFormDialog imports...")
 
-    try:
-        from ui_ctk.forms.caces_form import CacesFormDialog
+    if _IMPORTS_OK:
         print("  [OK] CacesFormDialog imports successfully")
         return True
-    except Exception as e:
-        print(f"  [FAIL] Import failed: {e}")
-        return False
+
+    print(f"  [FAIL] Import failed: {_IMPORT_ERROR}")
+    return False
 
 
 def test_caces_calculation():
@@ -64,12 +74,11 @@ def test_form_validation():
     try:
         # We can't easily test the full GUI form without actually opening it,
         # but we can test the validation logic structure
-        from ui_ctk.forms.caces_form import CacesFormDialog
+        assert _IMPORTS_OK, f"Import failed: {_IMPORT_ERROR}"
 
         # Check that the class has the required methods
-        assert hasattr(CacesFormDialog, 'validate'), "Missing validate method"
-        assert hasattr(CacesFormDialog, 'save'), "Missing save method"
-        assert hasattr(CacesFormDialog, 'parse_date'), "Missing parse_date method"
+        missing = REQUIRED_FORM_METHODS - set(dir(CacesFormDialog))
+        assert not missing, f"Missing methods: {', '.join(sorted(missing))}"
 
         print("  [OK] Form has all required methods")
         return True
@@ -84,10 +93,7 @@ def test_date_parsing():
     print("\n[TEST 4] Testing date parsing...")
 
     try:
-        from ui_ctk.forms.caces_form import CacesFormDialog
-
         # Can't instantiate without GUI, so we'll test the format itself
-        from datetime import datetime
         DATE_FORMAT = "%d/%m/%Y"
 
         # Test valid date
@@ -152,27 +158,25 @@ def main():
             traceback.print_exc()
             results[test_name] = False
 
-    # Summary
-    print("\n" + "=" * 70)
-    print(" TEST SUMMARY")
-    print("=" * 70)
-
+    # Summary, written in one call
     passed = sum(1 for v in results.values() if v)
     total = len(results)
 
+    rule = "=" * 70
+    summary = ["", rule, " TEST SUMMARY", rule]
     for test_name, result in results.items():
         status = "[PASS]" if result else "[FAIL]"
-        print(f"  {status} {test_name}")
+        summary.append(f"  {status} {test_name}")
 
-    print("\n" + "=" * 70)
+    summary += ["", rule]
     if passed == total:
-        print(f" [OK] ALL {total} TESTS PASSED")
-        print("=" * 70)
-        return 0
+        summary.append(f" [OK] ALL {total} TESTS PASSED")
     else:
-        print(f" [FAIL] {passed}/{total} tests passed")
-        print("=" * 70)
-        return 1
+        summary.append(f" [FAIL] {passed}/{total} tests passed")
+    summary.append(rule)
+
+    sys.stdout.write("\n".join(summary) + "\n")
+    return 0 if passed == total else 1
 
 
 if __name__ == "__main__":
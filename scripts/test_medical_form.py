@@ -144,27 +144,25 @@ def main():
             traceback.print_exc()
             results[test_name] = False
 
-    # Summary
-    print("\n" + "=" * 70)
-    print(" TEST SUMMARY")
-    print("=" * 70)
-
+    # Summary, written in one call
     passed = sum(1 for v in results.values() if v)
     total = len(results)
 
+    rule = "=" * 70
+    summary = ["", rule, " TEST SUMMARY", rule]
     for test_name, result in results.items():
         status = "[PASS]" if result else "[FAIL]"
-        print(f"  {status} {test_name}")
+        summary.append(f"  {status} {test_name}")
 
-    print("\n" + "=" * 70)
+    summary += ["", rule]
     if passed == total:
-        print(f" [OK] ALL {total} TESTS PASSED")
-        print("=" * 70)
-        return 0
+        summary.append(f" [OK] ALL {total} TESTS PASSED")
     else:
-        print(f" [FAIL] {passed}/{total} tests passed")
-        print("=" * 70)
-        return 1
+        summary.append(f" [FAIL] {passed}/{total} tests passed")
+    summary.append(rule)
+
+    sys.stdout.write("\n".join(summary) + "\n")
+    return 0 if passed == total else 1
 
 
 if __name__ == "__main__":
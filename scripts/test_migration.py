@@ -8,7 +8,7 @@ from datetime import date
 
 sys.path.insert(0, 'src')
 
-from database.connection import init_database
+from database.connection import database, init_database
 from employee.models import Employee
 
 
@@ -43,10 +43,10 @@ def test_migration(db_path: str = "test_employee.db"):
 
     # Test 3: Access phone and email fields
     print("\n[Test 3] Accessing new fields...")
-    for emp in employees:
-        # Should not raise AttributeError
-        _ = emp.phone
-        _ = emp.email
+    # Raw tuples: selecting the columns is enough to prove they exist,
+    # without building an Employee instance per row
+    contacts = list(Employee.select(Employee.phone, Employee.email).tuples())
+    assert len(contacts) == count
     print("[OK] Can access phone and email fields")
 
     # Test 4: Create employee with contact info
@@ -86,14 +86,52 @@ def test_migration(db_path: str = "test_employee.db"):
 
     # Test 7: Query with filters
     print("\n[Test 7] Querying with contact filters...")
-    with_phone = Employee.select().where(Employee.phone.is_null(False))
-    count_with_phone = with_phone.count()
+    count_with_phone = database.execute_sql(
+        "SELECT COUNT(*) FROM employees WHERE phone IS NOT NULL"
+    ).fetchone()[0]
     print(f"[OK] {count_with_phone} employees with phone")
 
-    with_email = Employee.select().where(Employee.email.is_null(False))
-    count_with_email = with_email.count()
+    count_with_email = database.execute_sql(
+        "SELECT COUNT(*) FROM employees WHERE email IS NOT NULL"
+    ).fetchone()[0]
     print(f"[OK] {count_with_email} employees with email")
 
+    # Test 8: Bulk insert in a single transaction
+    print("\n[Test 8] Bulk inserting employees...")
+    count_before = Employee.select().count()
+    rows = [
+        {
+            "first_name": "Bulk",
+            "last_name": f"User {i}",
+            "current_status": "active",
+            "workspace": "Zone C",
+            "role": "Testeur",
+            "contract_type": "CDI",
+            "entry_date": date(2024, 1, 1),
+            "phone": f"06 00 00 00 {i:02d}",
+            "email": f"bulk{i}@example.com",
+        }
+        for i in range(50)
+    ]
+    with database.atomic():
+        Employee.insert_many(rows).execute()
+    assert Employee.select().count() == count_before + len(rows)
+    Employee.delete().where(Employee.first_name == "Bulk").execute()
+    print(f"[OK] Inserted {len(rows)} employees in one transaction")
+
+    # Test 9: Raw executemany bulk insert (importer fast path)
+    print("\n[Test 9] Raw bulk inserting employees...")
+    from excel_import.excel_importer import raw_bulk_insert
+
+    inserted = raw_bulk_insert(rows)
+    assert inserted == len(rows)
+    assert Employee.select().count() == count_before + len(rows)
+    bulk_emp = Employee.select().where(Employee.first_name == "Bulk").first()
+    assert bulk_emp.entry_date == date(2024, 1, 1)
+    assert bulk_emp.created_at is not None
+    Employee.delete().where(Employee.first_name == "Bulk").execute()
+    print(f"[OK] Inserted {inserted} employees with executemany")
+
     print("\n" + "=" * 50)
     print(" [OK] ALL MIGRATION TESTS PASSED")
     print("=" * 50)
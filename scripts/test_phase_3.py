@@ -5,27 +5,71 @@ Integration test for Phase 3 - Employee Views
 Tests the complete employee management functionality.
 """
 
+import importlib
 import sys
+import threading
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 sys.path.insert(0, 'src')
 
-import customtkinter as ctk
 from employee.models import Employee
-from database.connection import database, init_database
+from database.connection import init_database
 from datetime import date
 
+if TYPE_CHECKING:
+    import customtkinter as ctk
 
-def test_employee_list_view():
+
+@dataclass
+class TestContext:
+    """State shared by all tests: one Tk root and one warm employee row."""
+
+    app: "ctk.CTk"
+    test_employee: Optional[Employee]
+
+    def reset(self):
+        """Destroy widgets left by a test so the next one starts clean."""
+        for child in self.app.winfo_children():
+            child.destroy()
+
+
+def import_customtkinter_worker():
+    """Import customtkinter off the main thread so it loads while the database opens."""
+    importlib.import_module("customtkinter")
+
+
+def load_test_employee() -> Optional[Employee]:
+    """Get an employee for the detail tests, creating one if the database is empty."""
+    try:
+        employee = Employee.select().first()
+        if not employee:
+            # Create test employee
+            employee = Employee.create(
+                first_name="Test",
+                last_name="User",
+                current_status="active",
+                workspace="Zone A",
+                role="Cariste",
+                contract_type="CDI",
+                entry_date=date(2024, 1, 15)
+            )
+        return employee
+    except Exception as e:
+        print(f"[WARN] Could not get test employee: {e}")
+        return None
+
+
+def test_employee_list_view(ctx: TestContext):
     """Test employee list view creation and functionality."""
     print("[TEST 1] Testing employee list view...")
 
     try:
         from ui_ctk.views.employee_list import EmployeeListView
 
-        # Create test app
-        app = ctk.CTk()
-        app.geometry("1000x700")
+        app = ctx.app
 
         # Create employee list view
         list_view = EmployeeListView(app, title="Test List")
@@ -51,9 +95,13 @@ def test_employee_list_view():
 
         print(f"  [OK] Loaded {len(list_view.employees)} employees")
 
-        # Cleanup
-        app.destroy()
+        # Related data is prefetched in one query per table, not per row
+        for emp in list_view.employees:
+            assert isinstance(emp.caces, list), "CACES should be prefetched"
+            assert isinstance(emp.medical_visits, list), "Medical visits should be prefetched"
+            assert isinstance(emp.trainings, list), "Trainings should be prefetched"
 
+        print("  [OK] Related data prefetched for all employees")
         return True
 
     except Exception as e:
@@ -63,15 +111,14 @@ def test_employee_list_view():
         return False
 
 
-def test_employee_form():
+def test_employee_form(ctx: TestContext):
     """Test employee form creation and validation."""
     print("\n[TEST 2] Testing employee form...")
 
     try:
         from ui_ctk.forms.employee_form import EmployeeFormDialog
 
-        # Create test app
-        app = ctk.CTk()
+        app = ctx.app
 
         # Create form (new employee mode)
         form = EmployeeFormDialog(app, title="Employé")
@@ -112,11 +159,6 @@ def test_employee_form():
         assert not form.validate_phone("123"), "Should reject invalid phone"
 
         print("  [OK] Phone validation works correctly")
-
-        # Cleanup
-        form.destroy()
-        app.destroy()
-
         return True
 
     except Exception as e:
@@ -126,34 +168,19 @@ def test_employee_form():
         return False
 
 
-def test_employee_detail_view():
+def test_employee_detail_view(ctx: TestContext):
     """Test employee detail view creation."""
     print("\n[TEST 3] Testing employee detail view...")
 
     try:
         from ui_ctk.views.employee_detail import EmployeeDetailView
 
-        # Create test app
-        app = ctk.CTk()
-        app.geometry("1000x700")
+        app = ctx.app
 
-        # Get or create test employee
-        try:
-            employee = Employee.select().first()
-            if not employee:
-                # Create test employee
-                employee = Employee.create(
-                    first_name="Test",
-                    last_name="User",
-                    current_status="active",
-                    workspace="Zone A",
-                    role="Cariste",
-                    contract_type="CDI",
-                    entry_date=date(2024, 1, 15)
-                )
-        except Exception as e:
-            print(f"  [WARN] Could not get test employee: {e}")
-            app.destroy()
+        # Shared test employee, loaded once in main()
+        employee = ctx.test_employee
+        if employee is None:
+            print("  [WARN] No test employee available")
             return False
 
         # Create detail view
@@ -163,10 +190,6 @@ def test_employee_detail_view():
         assert detail_view.employee == employee, "Employee should be set"
 
         print("  [OK] Detail view created successfully")
-
-        # Cleanup
-        app.destroy()
-
         return True
 
     except Exception as e:
@@ -176,7 +199,7 @@ def test_employee_detail_view():
         return False
 
 
-def test_search_filter_logic():
+def test_search_filter_logic(ctx: TestContext):
     """Test search and filter logic."""
     print("\n[TEST 4] Testing search and filter logic...")
 
@@ -184,9 +207,7 @@ def test_search_filter_logic():
         from ui_ctk.views.employee_list import EmployeeListView
         from ui_ctk.constants import STATUS_ACTIVE, STATUS_INACTIVE
 
-        # Create test app
-        app = ctk.CTk()
-        app.geometry("1000x700")
+        app = ctx.app
 
         # Create list view
         list_view = EmployeeListView(app, title="Test List")
@@ -229,10 +250,6 @@ def test_search_filter_logic():
             assert len(list_view.filtered_employees) >= 1, "Should find at least one employee"
 
             print(f"  [OK] Search works: found {len(list_view.filtered_employees)} employees")
-
-        # Cleanup
-        app.destroy()
-
         return True
 
     except Exception as e:
@@ -242,7 +259,7 @@ def test_search_filter_logic():
         return False
 
 
-def test_navigation():
+def test_navigation(ctx: TestContext):
     """Test navigation between views."""
     print("\n[TEST 5] Testing navigation...")
 
@@ -251,9 +268,7 @@ def test_navigation():
         from ui_ctk.views.employee_detail import EmployeeDetailView
         from ui_ctk.main_window import MainWindow
 
-        # Create test app
-        app = ctk.CTk()
-        app.geometry("1000x700")
+        app = ctx.app
 
         # Create main window
         main_window = MainWindow(app)
@@ -264,9 +279,9 @@ def test_navigation():
 
         print("  [OK] Main window shows employee list by default")
 
-        # Get test employee
+        # Shared test employee, loaded once in main()
         try:
-            employee = Employee.select().first()
+            employee = ctx.test_employee
             if employee:
                 # Test navigation to detail
                 main_window.switch_view(EmployeeDetailView, employee=employee)
@@ -276,10 +291,6 @@ def test_navigation():
 
         except Exception as e:
             print(f"  [WARN] Could not test detail navigation: {e}")
-
-        # Cleanup
-        app.destroy()
-
         return True
 
     except Exception as e:
@@ -353,20 +364,27 @@ def main():
     print(" Testing Employee Views")
     print("=" * 70)
 
-    # Initialize database
-    db_path = Path("employee_manager.db")
-    init_database(db_path)
+    # Load Tk in the background while the database opens; init_database stays
+    # on the main thread so its PRAGMAs apply to the connection the tests use
+    ctk_thread = threading.Thread(target=import_customtkinter_worker)
+    ctk_thread.start()
+
+    init_database(Path("employee_manager.db"))
 
-    # Connect to database
-    if database.is_closed():
-        database.connect()
+    ctk_thread.join()
+    import customtkinter as ctk
+
+    # One Tk root and one employee row, reused by every test
+    app = ctk.CTk()
+    app.geometry("1000x700")
+    ctx = TestContext(app=app, test_employee=load_test_employee())
 
     tests = [
-        ("Employee List View", test_employee_list_view),
-        ("Employee Form", test_employee_form),
-        ("Employee Detail View", test_employee_detail_view),
-        ("Search and Filter Logic", test_search_filter_logic),
-        ("Navigation", test_navigation),
+        ("Employee List View", partial(test_employee_list_view, ctx)),
+        ("Employee Form", partial(test_employee_form, ctx)),
+        ("Employee Detail View", partial(test_employee_detail_view, ctx)),
+        ("Search and Filter Logic", partial(test_search_filter_logic, ctx)),
+        ("Navigation", partial(test_navigation, ctx)),
         ("Constants", test_constants),
     ]
 
@@ -380,28 +398,30 @@ def main():
             import traceback
             traceback.print_exc()
             results[test_name] = False
+        finally:
+            ctx.reset()
 
-    # Summary
-    print("\n" + "=" * 70)
-    print(" TEST SUMMARY")
-    print("=" * 70)
+    app.destroy()
 
+    # Summary, written in one call
     passed = sum(1 for v in results.values() if v)
     total = len(results)
 
+    rule = "=" * 70
+    summary = ["", rule, " TEST SUMMARY", rule]
     for test_name, result in results.items():
         status = "[PASS]" if result else "[FAIL]"
-        print(f"  {status} {test_name}")
+        summary.append(f"  {status} {test_name}")
 
-    print("\n" + "=" * 70)
+    summary += ["", rule]
     if passed == total:
-        print(f" [OK] ALL {total} TESTS PASSED")
-        print("=" * 70)
-        return 0
+        summary.append(f" [OK] ALL {total} TESTS PASSED")
     else:
-        print(f" [FAIL] {passed}/{total} tests passed")
-        print("=" * 70)
-        return 1
+        summary.append(f" [FAIL] {passed}/{total} tests passed")
+    summary.append(rule)
+
+    sys.stdout.write("\n".join(summary) + "\n")
+    return 0 if passed == total else 1
 
 
 if __name__ == "__main__":
@@ -10,8 +10,12 @@ Usage:
         print(f"Update available: {update_info['version']}")
 """
 
+import json
 import os
 import sys
+import tempfile
+import time
+from pathlib import Path
 from typing import Dict, Optional
 
 try:
@@ -29,12 +33,23 @@ setup_logging(level="INFO", enable_console=True, enable_file=False)
 logger = get_logger(__name__)
 
 
+# Shared session, created on first use (see get_http_session)
+_http_session = None
+
+
 class UpdateChecker:
     """Check for application updates from GitHub Releases."""
 
     GITHUB_API_URL = "https://api.github.com/repos/wareflowx/wareflow-ems/releases/latest"
     GITHUB_RELEASES_URL = "https://api.github.com/repos/wareflowx/wareflow-weapons/releases"
 
+    # Latest release JSON is cached on disk so repeated checks skip the network
+    CACHE_PATH = Path(tempfile.gettempdir()) / "wareflow_update_cache.json"
+    CACHE_TTL = 3600  # seconds
+
+    # Installed version never changes within a process
+    _cached_current_version: Optional[str] = None
+
     def __init__(self, current_version: str = None, timeout: int = 10):
         """Initialize update checker.
 
@@ -47,17 +62,38 @@ class UpdateChecker:
 
         self.current_version = current_version
         self.timeout = timeout
+        self._current_version_parsed = self._parse_current_version()
+
+    def _parse_current_version(self):
+        """Parse current_version once for all later comparisons.
+
+        Returns:
+            Parsed Version, or None if packaging is missing or the version is invalid
+        """
+        if parse_version is None:
+            return None
+        try:
+            return parse_version(self.current_version)
+        except Exception as e:
+            logger.error(f"Failed to parse current version {self.current_version!r}: {e}")
+            return None
+
+    @classmethod
+    def _get_current_version(cls) -> str:
+        """Get current version from employee_manager module (cached per process)."""
+        if cls._cached_current_version is not None:
+            return cls._cached_current_version
 
-    def _get_current_version(self) -> str:
-        """Get current version from employee_manager module."""
         try:
             from employee_manager import __version__
             # Remove 'v' prefix if present
             version = __version__.lstrip('v')
-            return version
         except ImportError:
             logger.warning("Could not import __version__ from employee_manager")
-            return "0.0.0"
+            version = "0.0.0"
+
+        cls._cached_current_version = version
+        return version
 
     def check_for_updates(self) -> Optional[Dict]:
         """Check for updates from GitHub Releases API.
@@ -81,14 +117,11 @@ class UpdateChecker:
         try:
             logger.info(f"Checking for updates (current: {self.current_version})...")
 
-            # Fetch latest release from GitHub API
-            response = requests.get(
-                self.GITHUB_API_URL,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-
-            release = response.json()
+            cached = self._load_cache()
+            if cached is not None and time.time() - cached['fetched_at'] < self.CACHE_TTL:
+                release = cached['release']
+            else:
+                release = self._fetch_release(cached)
 
             # Extract version from tag name
             tag_name = release.get('tag_name', '')
@@ -123,6 +156,92 @@ class UpdateChecker:
             logger.error(f"Unexpected error checking for updates: {e}")
             return None
 
+    def _fetch_release(self, cached: Optional[Dict]) -> Dict:
+        """Fetch the latest release, revalidating a stale cache entry with its ETag.
+
+        A 304 Not Modified answer reuses the cached release and only renews
+        its timestamp, so the release JSON is neither downloaded nor parsed.
+
+        Args:
+            cached: Stale cache entry from _load_cache(), or None
+
+        Returns:
+            Release dictionary
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        headers = {}
+        etag = cached.get('etag') if cached else None
+        if etag:
+            headers['If-None-Match'] = etag
+
+        # Fetch latest release from GitHub API
+        response = get_http_session().get(
+            self.GITHUB_API_URL,
+            headers=headers,
+            timeout=self.timeout
+        )
+
+        if response.status_code == 304 and cached is not None:
+            release = cached['release']
+        else:
+            response.raise_for_status()
+            release = response.json()
+            etag = response.headers.get('ETag')
+
+        self._save_cached_release(release, etag)
+        return release
+
+    def _load_cache(self) -> Optional[Dict]:
+        """Load the cache entry for the current API URL, whatever its age.
+
+        Returns:
+            Dictionary with 'fetched_at', 'release' and 'etag', or None if
+            there is no usable entry
+        """
+        try:
+            with open(self.CACHE_PATH, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        try:
+            if cached['url'] != self.GITHUB_API_URL:
+                return None
+            return {
+                'fetched_at': float(cached['fetched_at']),
+                'release': cached['release'],
+                'etag': cached.get('etag'),
+            }
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+    def _save_cached_release(self, release: Dict, etag: Optional[str] = None) -> None:
+        """Atomically write the release to the cache file.
+
+        Args:
+            release: Release dictionary returned by the GitHub API
+            etag: ETag header of the response, used to revalidate later
+        """
+        cached = {
+            'fetched_at': time.time(),
+            'url': self.GITHUB_API_URL,
+            'release': release,
+            'etag': etag,
+        }
+        tmp_path = self.CACHE_PATH.with_name(f"{self.CACHE_PATH.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cached, f)
+            os.replace(tmp_path, self.CACHE_PATH)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write update cache: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
     def _is_newer_version(self, latest_version: str) -> bool:
         """Check if latest version is newer than current version.
 
@@ -132,8 +251,10 @@ class UpdateChecker:
         Returns:
             True if latest_version is newer
         """
+        if self._current_version_parsed is None:
+            return False
         try:
-            return parse_version(latest_version) > parse_version(self.current_version)
+            return parse_version(latest_version) > self._current_version_parsed
         except Exception as e:
             logger.error(f"Failed to compare versions: {e}")
             return False
@@ -154,6 +275,26 @@ class UpdateChecker:
         }
 
 
+def get_http_session():
+    """Get the shared HTTP session used for GitHub requests.
+
+    Reusing one session keeps TLS connections alive between the release
+    check and the asset download instead of reconnecting for each request.
+
+    Returns:
+        requests.Session with a small connection pool and our User-Agent
+    """
+    global _http_session
+    if _http_session is None:
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        session.headers['User-Agent'] = f"wareflow-ems/{UpdateChecker._get_current_version()}"
+        _http_session = session
+    return _http_session
+
+
 def check_for_updates(current_version: str = None) -> Optional[Dict]:
     """Convenience function to check for updates.
 
@@ -15,25 +15,39 @@ Usage:
     wems update --path "C:/custom/path"
 """
 
+import ctypes
+import ctypes.util
+import functools
 import hashlib
+import io
+import itertools
 import os
 import shutil
+import sqlite3
 import sys
 import tempfile
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
-import requests
 import typer
-from rich.console import Console
-from rich.progress import Progress, BarColumn, TextColumn, DownloadColumn, TransferSpeedColumn
 
-from bootstrapper.update_checker import UpdateChecker, get_update_info, is_update_available
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# requests, rich and the update checker are imported where they are used:
+# this module is loaded to register the command on every CLI start-up
 from database.connection import database
 from database.migration_model import get_applied_migrations
-from utils.logging_config import setup_logging, get_logger
+from utils.logging_config import get_logger, setup_logging
 
 # Setup logging
 setup_logging(level="INFO", enable_console=True, enable_file=True)
@@ -46,11 +60,44 @@ app = typer.Typer(
     add_completion=True,
 )
 
-console = Console()
+_console = None
+
+
+def _get_console():
+    """Get the shared rich Console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+class _LazyConsole:
+    """Module-level console stand-in that defers importing rich until first use."""
+
+    def __getattr__(self, name):
+        return getattr(_get_console(), name)
 
 
+console = _LazyConsole()
+
+# Read downloads in 1 MiB chunks: far fewer Python iterations, writes and
+# progress refreshes per release archive than the old 8 KB chunks
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# First bytes of every SQLite 3 database file
+SQLITE_HEADER = b"SQLite format 3\0"
+
+MIGRATIONS_DIR = Path("src/database/migrations")
+
+# Migration discovery results, keyed by resolved directory:
+# path -> ((dir mtime_ns, entry count), migrations pending at scan time)
+_last_scan = {}
+
+
+@functools.lru_cache(maxsize=1)
 def get_current_version() -> str:
-    """Get current application version."""
+    """Get current application version (cached per process)."""
     try:
         from employee_manager import __version__
         return __version__.lstrip('v')
@@ -58,22 +105,39 @@ def get_current_version() -> str:
         return "unknown"
 
 
-def download_file(url: str, dest_path: Path, show_progress: bool = True) -> Path:
+def download_file(
+    url: str,
+    dest_path: Path,
+    show_progress: bool = True,
+    hasher=None
+) -> Tuple[Path, str]:
     """Download file from URL with optional progress bar.
 
+    The file is hashed while it is written, so it does not need to be read
+    back for checksum verification.
+
     Args:
         url: URL to download from
         dest_path: Destination path
         show_progress: Whether to show progress bar
+        hasher: hashlib object to feed the downloaded bytes (default: SHA256)
 
     Returns:
-        Path to downloaded file
+        Tuple of (path to downloaded file, hex digest of its content)
     """
+    import requests
+    from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn, TransferSpeedColumn
+
+    from bootstrapper.update_checker import get_http_session
+
+    if hasher is None:
+        hasher = hashlib.sha256()
+
     if show_progress:
         console.print(f"[cyan]📥 Downloading from:[/cyan] {url}")
 
     try:
-        response = requests.get(url, stream=True, timeout=30)
+        response = get_http_session().get(url, stream=True, timeout=30)
         response.raise_for_status()
 
         dest_path.parent.mkdir(parents=True, exist_ok=True)
@@ -88,7 +152,7 @@ def download_file(url: str, dest_path: Path, show_progress: bool = True) -> Path
                     TransferSpeedColumn(),
                     TextColumn("[bold green]{task.completed} / {task.total}"),
                 ],
-                console=console,
+                console=_get_console(),
             ) as progress:
                 task = progress.add_task(
                     "Downloading",
@@ -96,42 +160,93 @@ def download_file(url: str, dest_path: Path, show_progress: bool = True) -> Path
                 )
 
                 with open(dest_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                         f.write(chunk)
+                        hasher.update(chunk)
                         progress.update(task, advance=len(chunk))
         else:
+            content = response.content
             with open(dest_path, 'wb') as f:
-                f.write(response.content)
+                f.write(content)
+            hasher.update(content)
 
         console.print("[green]✓ Download complete[/green]")
-        return dest_path
+        return dest_path, hasher.hexdigest()
 
     except requests.RequestException as e:
         console.print(f"[red]✗ Download failed: {e}[/red]")
         raise
 
 
-def verify_checksum(download_path: Path, expected_checksum: Optional[str] = None) -> bool:
-    """Verify SHA256 checksum of downloaded file.
+def checksum_algorithm(expected_checksum: Optional[str]) -> str:
+    """Get the hash algorithm named by a checksum prefix.
+
+    Args:
+        expected_checksum: Checksum such as "blake3:<hex>" or "sha256:<hex>"
+
+    Returns:
+        "blake3" for blake3-prefixed checksums, "sha256" otherwise
+    """
+    if expected_checksum and expected_checksum.lower().startswith('blake3:'):
+        return 'blake3'
+    return 'sha256'
+
+
+def new_hasher(expected_checksum: Optional[str] = None):
+    """Create a hasher matching the algorithm of the expected checksum.
+
+    Falls back to SHA256 when BLAKE3 is requested but not installed.
+
+    Args:
+        expected_checksum: Checksum that will be verified (optional)
+
+    Returns:
+        Hash object with update() and hexdigest()
+    """
+    if checksum_algorithm(expected_checksum) == 'blake3' and blake3 is not None:
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.sha256()
+
+
+def verify_checksum(
+    download_path: Path,
+    expected_checksum: Optional[str] = None,
+    precomputed: Optional[str] = None
+) -> bool:
+    """Verify SHA256 or BLAKE3 checksum of downloaded file.
+
+    The algorithm is taken from the checksum prefix ("blake3:" or "sha256:");
+    unprefixed checksums are SHA256. BLAKE3 needs the optional blake3 package.
 
     Args:
         download_path: Path to downloaded file
-        expected_checksum: Expected SHA256 checksum (optional)
+        expected_checksum: Expected checksum (optional)
+        precomputed: Digest already computed during download with the same
+            algorithm (optional)
 
     Returns:
         True if checksum matches (or no expected checksum provided)
     """
     console.print("[cyan]🔒 Verifying checksum...[/cyan]")
 
-    sha256_hash = hashlib.sha256()
-    with open(download_path, 'rb') as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
+    algorithm = checksum_algorithm(expected_checksum)
+    if algorithm == 'blake3' and blake3 is None:
+        console.print("[red]✗ BLAKE3 checksum requires the blake3 package[/red]")
+        return False
 
-    checksum = sha256_hash.hexdigest()
+    if precomputed is not None:
+        checksum = precomputed
+    elif algorithm == 'blake3':
+        # Memory-maps the file and hashes it on several threads
+        checksum = blake3.blake3(max_threads=blake3.blake3.AUTO).update_mmap(download_path).hexdigest()
+    else:
+        # file_digest hashes in C over large buffers instead of a Python read loop
+        with open(download_path, 'rb') as f:
+            checksum = hashlib.file_digest(f, 'sha256').hexdigest()
 
     if expected_checksum:
-        if checksum != expected_checksum.lower().replace('sha256:', '').replace('sha256:', ''):
+        expected_clean = expected_checksum.strip().lower().removeprefix(f'{algorithm}:')
+        if checksum != expected_clean:
             console.print(f"[red]✗ Checksum mismatch![/red]")
             console.print(f"  Expected: {expected_checksum}")
             console.print(f"  Got:      {checksum}")
@@ -144,6 +259,86 @@ def verify_checksum(download_path: Path, expected_checksum: Optional[str] = None
         return True
 
 
+def _reflink(src: Path, dst: Path) -> bool:
+    """Clone src to dst as a copy-on-write reflink.
+
+    Uses the FICLONE ioctl on Linux (Btrfs, XFS) and clonefile() on macOS
+    (APFS), which share data blocks instead of copying them.
+
+    Args:
+        src: Source file
+        dst: Destination file (replaced if it exists)
+
+    Returns:
+        True if the file was cloned, False if the platform or filesystem
+        does not support it
+    """
+    if fcntl is not None and hasattr(fcntl, 'FICLONE'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), fcntl.FICLONE, fsrc.fileno())
+            return True
+        except OSError:
+            return False
+
+    if sys.platform == 'darwin':
+        libc_path = ctypes.util.find_library('c')
+        if not libc_path:
+            return False
+        clonefile = ctypes.CDLL(libc_path, use_errno=True).clonefile
+        # clonefile() refuses to overwrite, so clone next to dst and swap it in
+        tmp_path = dst.with_name(f".{dst.name}.clone")
+        if clonefile(os.fsencode(src), os.fsencode(tmp_path), 0) != 0:
+            return False
+        os.replace(tmp_path, dst)
+        return True
+
+    return False
+
+
+def copy_file(src: Path, dst: Path) -> None:
+    """Copy a file with metadata, using a reflink when the filesystem supports it.
+
+    Args:
+        src: Source file
+        dst: Destination file
+    """
+    if _reflink(src, dst):
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
+
+
+def is_sqlite_file(path: Path) -> bool:
+    """Check whether a file starts with the SQLite 3 header."""
+    with open(path, "rb") as f:
+        return f.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+
+
+def sqlite_backup(data_path: Path, backup_path: Path) -> None:
+    """Copy a SQLite database with the online backup API.
+
+    Unlike a file copy, this yields a consistent snapshot including frames
+    still in the WAL, even while the application holds the database open.
+
+    Args:
+        data_path: Source database file
+        backup_path: Destination database file
+
+    Raises:
+        sqlite3.DatabaseError: If the backup fails (e.g. the database is locked)
+    """
+    src = sqlite3.connect(data_path)
+    try:
+        dst = sqlite3.connect(backup_path)
+        try:
+            src.backup(dst, pages=-1)
+        finally:
+            dst.close()
+    finally:
+        src.close()
+
+
 def create_backup(data_path: Path) -> Path:
     """Create backup of database before update.
 
@@ -152,6 +347,9 @@ def create_backup(data_path: Path) -> Path:
 
     Returns:
         Path to backup file
+
+    Raises:
+        sqlite3.DatabaseError: If a SQLite database cannot be backed up
     """
     if not data_path.exists():
         console.print(f"[yellow]⚠ No database file found at {data_path}, skipping backup[/yellow]")
@@ -168,7 +366,12 @@ def create_backup(data_path: Path) -> Path:
     console.print(f"  From: {data_path}")
     console.print(f"  To:   {backup_path}")
 
-    shutil.copy2(data_path, backup_path)
+    if is_sqlite_file(data_path):
+        # Errors such as a locked database propagate: a raw copy of a live
+        # database is exactly what the backup API is there to avoid
+        sqlite_backup(data_path, backup_path)
+    else:
+        copy_file(data_path, backup_path)
     console.print("[green]✓ Backup created[/green]")
 
     return backup_path
@@ -189,7 +392,7 @@ def restore_backup(backup_path: Path, data_path: Path) -> bool:
     console.print(f"  To:   {data_path}")
 
     try:
-        shutil.copy2(backup_path, data_path)
+        copy_file(backup_path, data_path)
         console.print("[green]✓ Database restored[/green]")
         return True
     except Exception as e:
@@ -197,6 +400,37 @@ def restore_backup(backup_path: Path, data_path: Path) -> bool:
         return False
 
 
+def pending_migrations(migrations_dir: Path = MIGRATIONS_DIR) -> list:
+    """Get pending migrations, reusing the last scan if the directory is unchanged.
+
+    A retried update in the same process skips re-importing and re-scanning
+    every migration file; migrations applied since the scan are filtered out.
+
+    Args:
+        migrations_dir: Path to migrations directory
+
+    Returns:
+        List of migration instances that need to be applied
+    """
+    from database.migrations.base import get_pending_migrations
+
+    key = migrations_dir.resolve()
+    try:
+        stat = key.stat()
+        fingerprint = (stat.st_mtime_ns, sum(1 for _ in key.iterdir()))
+    except OSError:
+        return get_pending_migrations(migrations_dir)
+
+    cached = _last_scan.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        applied = get_applied_migrations()
+        return [m for m in cached[1] if m.name not in applied]
+
+    pending = get_pending_migrations(migrations_dir)
+    _last_scan[key] = (fingerprint, pending)
+    return pending
+
+
 def run_migrations() -> bool:
     """Run database migrations.
 
@@ -206,7 +440,8 @@ def run_migrations() -> bool:
     console.print("[cyan]🔄 Running database migrations...[/cyan]")
 
     try:
-        from database.migrations.base import get_pending_migrations
+        from rich.progress import BarColumn, Progress, TextColumn
+
         from database.migrations.base import run_migration
 
         # Connect to database
@@ -214,7 +449,7 @@ def run_migrations() -> bool:
             database.connect()
 
         # Get pending migrations
-        pending = get_pending_migrations(Path("src/database/migrations"))
+        pending = pending_migrations()
 
         if not pending:
             console.print("[green]✓ No migrations to run[/green]")
@@ -230,18 +465,18 @@ def run_migrations() -> bool:
                 BarColumn(bar_width=None),
                 TextColumn("[bold green]{task.completed} / {task.total}"),
             ],
-            console=console,
+            console=_get_console(),
         ) as progress:
+            # One bar for the whole run instead of one task per migration
+            task = progress.add_task("Running migrations", total=len(pending))
+
             for migration in pending:
-                task = progress.add_task(
-                    f"Running {migration.name}",
-                    total=1
-                )
+                progress.update(task, description=f"Running {migration.name}")
 
                 success = run_migration(migration, batch)
 
                 if success:
-                    progress.update(task, completed=1)
+                    progress.advance(task)
                 else:
                     console.print(f"[red]✗ Migration {migration.name} failed[/red]")
                     return False
@@ -254,6 +489,22 @@ def run_migrations() -> bool:
         return False
 
 
+def _trim_body(body: str, max_lines: int = 10) -> List[str]:
+    """Get the first non-empty lines of release notes.
+
+    Lines are read lazily, so long release notes are never split in full.
+
+    Args:
+        body: Release notes text
+        max_lines: Maximum number of lines to return
+
+    Returns:
+        Up to max_lines non-empty lines
+    """
+    lines = (line.rstrip('\r\n') for line in io.StringIO(body))
+    return list(itertools.islice(filter(str.strip, lines), max_lines))
+
+
 def get_download_url(release_info: dict) -> str:
     """Get download URL for the appropriate platform.
 
@@ -272,6 +523,23 @@ def get_download_url(release_info: dict) -> str:
     return f"https://github.com/wareflowx/wareflow-ems/archive/refs/tags/{tag_name}.zip"
 
 
+def _prepare_update_info(update_info: dict) -> dict:
+    """Precompute values derived from the release, once per command.
+
+    Adds '_download_url' and '_trimmed_body' to update_info in place so every
+    consumer in the command reuses them.
+
+    Args:
+        update_info: Update information from UpdateChecker.check_for_updates
+
+    Returns:
+        The same dictionary
+    """
+    update_info['_download_url'] = get_download_url(update_info)
+    update_info['_trimmed_body'] = _trim_body(update_info.get('body') or '')
+    return update_info
+
+
 def update_application(
     preview: bool = False,
     force: bool = False,
@@ -295,6 +563,8 @@ def update_application(
     console.print(f"Current version: [cyan]{current_version}[/cyan]\n")
 
     # Check for updates
+    from bootstrapper.update_checker import UpdateChecker
+
     checker = UpdateChecker(current_version)
     update_info = checker.check_for_updates()
 
@@ -302,16 +572,15 @@ def update_application(
         console.print("[green]✓ Already up to date![/green]")
         return True
 
+    _prepare_update_info(update_info)
     latest_version = update_info['version']
     console.print(f"[bold green]Update available:[/bold green] {current_version} → [bold yellow]{latest_version}[/bold yellow]\n")
 
     # Show release notes
     console.print("[bold]What's new:[/bold]")
     # Show first few lines of release notes
-    body_lines = update_info.get('body', '').split('\n')[:10]
-    for line in body_lines:
-        if line.strip():
-            console.print(f"  {line}")
+    for line in update_info['_trimmed_body']:
+        console.print(f"  {line}")
     console.print(f"\n  Full notes: {update_info.get('html_url', '')}\n")
 
     if preview:
@@ -346,17 +615,28 @@ def update_application(
 
     # Download update
     try:
-        download_url = get_download_url(update_info)
+        download_url = update_info['_download_url']
+        expected_checksum = update_info.get('checksum')
 
         with tempfile.TemporaryDirectory() as tmpdir:
             temp_path = Path(tmpdir) / "update.zip"
 
-            # Download
-            download_file(download_url, temp_path)
+            # Download (hashed on the fly)
+            _, digest = download_file(
+                download_url,
+                temp_path,
+                hasher=new_hasher(expected_checksum)
+            )
 
             # Verify checksum (if provided in release)
-            # For now, we skip this as GitHub doesn't provide checksums by default
-            # In production, we would host checksums separately
+            # GitHub doesn't provide checksums by default, so this usually
+            # just reports the digest; in production we would host checksums separately
+            if not verify_checksum(
+                temp_path,
+                expected_checksum=expected_checksum,
+                precomputed=digest
+            ):
+                raise ValueError("Downloaded update failed checksum verification")
 
             # Extract and validate
             console.print("\n[cyan]Validating update...[/cyan]")
@@ -407,6 +687,8 @@ def check(
     json: bool = typer.Option(False, help="Output as JSON")
 ):
     """Check for updates."""
+    from bootstrapper.update_checker import get_update_info
+
     info = get_update_info()
 
     if json:
@@ -423,14 +705,13 @@ def check(
             console.print(f"  Latest:  {latest}")
 
             if info['update_info']:
+                update_info = _prepare_update_info(info['update_info'])
                 console.print(f"\nRelease notes:")
-                body = info['update_info'].get('body', '')
-                if body:
+                if update_info.get('body'):
                     # Show first few lines
-                    for line in body.split('\n')[:10]:
-                        if line.strip():
-                            console.print(f"  {line}")
-                    console.print(f"\n  URL: {info['update_info'].get('html_url', '')}")
+                    for line in update_info['_trimmed_body']:
+                        console.print(f"  {line}")
+                    console.print(f"\n  URL: {update_info.get('html_url', '')}")
         else:
             console.print(f"[green]✓ Already up to date![/green]")
             console.print(f"  Version: {current}")
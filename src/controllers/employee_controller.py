@@ -152,8 +152,9 @@ class EmployeeController:
                          .select()
                          .where((Employee.current_status == 'active') &
                                 (Employee.deleted_at.is_null()))  # Also exclude soft-deleted
-                         .prefetch(Caces, MedicalVisit, OnlineTraining)
-                         .order_by(Employee.last_name, Employee.first_name))
+                         .order_by(Employee.last_name, Employee.first_name)
+                         # prefetch() runs the queries and returns a list, so it comes last
+                         .prefetch(Caces, MedicalVisit, OnlineTraining))
         return employees
 
     def create_employee(self, **kwargs) -> Employee:
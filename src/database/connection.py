@@ -26,7 +26,7 @@ def init_database(db_path: Path) -> None:
     # Import all models here to avoid circular imports
     from employee.models import Caces, Employee, MedicalVisit, OnlineTraining, Contract, ContractAmendment
     from lock.models import AppLock
-    from database.migration_model import Migration
+    from database.migration_model import Migration, MigrationState
 
     # Create all tables
     database.create_tables(
@@ -39,6 +39,7 @@ def init_database(db_path: Path) -> None:
             ContractAmendment,
             AppLock,
             Migration,
+            MigrationState,
         ],
         safe=True,
     )
@@ -4,27 +4,66 @@ This module handles automatic database migrations on application startup,
 ensuring the database schema is always up to date with the application version.
 """
 
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 from database.connection import database
-from database.migrations import get_pending_migrations
-from database.migration_model import get_applied_migrations, get_last_batch_number
+from database.migrations import (
+    call_pre_check,
+    get_existing_tables,
+    get_pending_migrations,
+    init_migration_logging,
+)
+from database.migration_model import (
+    Migration,
+    get_applied_migrations,
+    get_last_batch_number,
+    get_migration_state,
+    set_migration_state,
+)
 from database.version import check_migration_needed, initialize_version_tracking
 from database.version_model import AppVersion, get_current_app_version, set_version
 from database.version import APP_VERSION, SCHEMA_VERSION
 from database.migration_validation import validate_before_migration, validate_after_migration
-from employee.models import Caces, Employee, MedicalVisit, OnlineTraining
-from lock.models import AppLock
 from utils.backup_manager import BackupManager
-from utils.logging_config import setup_logging, get_logger
+from utils.logging_config import get_logger
 
-# Setup logging
-setup_logging(level="INFO", enable_console=True, enable_file=True)
 logger = get_logger(__name__)
 
+# Pending migrations reused while the migrations directory is unchanged:
+# (migrations dir, database path) -> (dir mtime_ns, pending migrations,
+# names of migrations that failed to load).
+# Cleared after a successful migration run.
+_migration_state_cache = {}
+
+# migration_state key of the stamp left by the last scan that found nothing pending
+MIGRATIONS_STAMP_KEY = "pending_scan_stamp"
+
+
+def _migrations_stamp(mtime_ns: int) -> str:
+    """Combine the migrations dir mtime and applied count into one stamp."""
+    count = Migration.select().count()
+    return f"{mtime_ns}:{count}"
+
+
+def _read_migrations_stamp() -> Optional[str]:
+    """Read the stamp left by the last run that found nothing pending."""
+    try:
+        return get_migration_state(MIGRATIONS_STAMP_KEY)
+    except Exception:
+        return None
+
+
+def _write_migrations_stamp(mtime_ns: int) -> None:
+    """Record that nothing is pending for this mtime and applied count."""
+    try:
+        set_migration_state(MIGRATIONS_STAMP_KEY, _migrations_stamp(mtime_ns))
+    except Exception as e:
+        logger.debug(f"Could not store migrations stamp: {e}")
+
 
 class MigrationManager:
     """Manager for automatic database migrations."""
@@ -35,6 +74,8 @@ class MigrationManager:
         Args:
             backup_manager: Optional backup manager for creating pre-migration backups
         """
+        init_migration_logging(enable_file=True)
+
         self.backup_manager = backup_manager or BackupManager()
         self.migrations_dir = Path(__file__).parent / "migrations"
 
@@ -83,11 +124,42 @@ class MigrationManager:
             List of migration instances to apply
         """
         try:
-            return get_pending_migrations(self.migrations_dir)
+            key = (self.migrations_dir, database.database)
+            mtime = os.stat(self.migrations_dir).st_mtime_ns
+
+            cached = _migration_state_cache.get(key)
+            if cached is not None and cached[0] == mtime:
+                # Each migration commits on its own, so a partially failed
+                # run leaves applied migrations in the cached list
+                applied = get_applied_migrations()
+                return [m for m in cached[1] if m.name not in applied]
+
+            # Fast path for an already migrated database: same directory
+            # mtime and applied count as the last empty scan, so skip
+            # importing every migration module
+            if self._stamp_matches(mtime):
+                _migration_state_cache[key] = (mtime, [], [])
+                return []
+
+            failed = []
+            pending = get_pending_migrations(self.migrations_dir, failed)
+            _migration_state_cache[key] = (mtime, pending, failed)
+            return list(pending)
         except Exception as e:
             logger.error(f"Failed to get pending migrations: {e}")
             return []
 
+    def _stamp_matches(self, mtime_ns: int) -> bool:
+        """Check the stored migrations stamp against the current state."""
+        stored = _read_migrations_stamp()
+        if not stored:
+            return False
+        try:
+            return stored == _migrations_stamp(mtime_ns)
+        except Exception:
+            # No migrations table yet
+            return False
+
     def _perform_migration(self, pending_migrations: List) -> Tuple[bool, str]:
         """Perform database migration with safety measures.
 
@@ -115,22 +187,27 @@ class MigrationManager:
             # Get next batch number
             batch = get_last_batch_number() + 1
 
+            # One sqlite_master scan shared by the pre-checks, refreshed only
+            # after a migration has actually changed the schema
+            existing_tables = get_existing_tables()
+
             # Apply migrations sequentially
             for i, migration in enumerate(pending_migrations, 1):
                 migration_name = migration.name if hasattr(migration, 'name') else f"migration_{i}"
                 logger.info(f"Applying migration {i}/{len(pending_migrations)}: {migration_name}")
 
                 # Pre-check
-                if hasattr(migration, 'pre_check') and not migration.pre_check():
+                if hasattr(migration, 'pre_check') and not call_pre_check(migration, existing_tables):
                     error_msg = f"Migration pre-check failed: {migration_name}"
                     logger.error(error_msg)
                     return False, error_msg
 
                 # Apply migration
-                if not self._apply_single_migration(migration, batch):
+                if not self._apply_single_migration(migration, batch, existing_tables):
                     error_msg = f"Migration failed: {migration_name}"
                     logger.error(error_msg)
                     return False, error_msg
+                existing_tables = get_existing_tables()
 
                 # Post-check
                 if hasattr(migration, 'post_check') and not migration.post_check():
@@ -155,7 +232,10 @@ class MigrationManager:
             logger.info("Post-migration validation passed")
 
             # Update version record after all migrations succeed
-            self._update_version_record()
+            self._update_version_record(batch)
+
+            # Pending lists computed before this run are now stale
+            _migration_state_cache.clear()
 
             success_msg = f"Successfully applied {len(pending_migrations)} migration(s)"
             logger.info(success_msg)
@@ -167,12 +247,15 @@ class MigrationManager:
             logger.error(error_msg)
             return False, error_msg
 
-    def _apply_single_migration(self, migration, batch: int) -> bool:
+    def _apply_single_migration(
+        self, migration, batch: int, existing_tables: Optional[set] = None
+    ) -> bool:
         """Apply a single migration.
 
         Args:
             migration: Migration instance to apply
             batch: Batch number for this migration run
+            existing_tables: Optional table names to hand to pre_check()
 
         Returns:
             True if migration succeeded, False otherwise
@@ -182,15 +265,19 @@ class MigrationManager:
             from database.migrations import run_migration
 
             # Run migration
-            success = run_migration(migration, batch)
+            success = run_migration(migration, batch, existing_tables)
             return success
 
         except Exception as e:
             logger.error(f"Failed to apply migration: {e}")
             return False
 
-    def _update_version_record(self) -> None:
-        """Update the version record in database after successful migration."""
+    def _update_version_record(self, batch: Optional[int] = None) -> None:
+        """Update the version record in database after successful migration.
+
+        Args:
+            batch: Batch number just applied; looked up if not given
+        """
         try:
             if database.is_closed():
                 database.connect()
@@ -202,14 +289,20 @@ class MigrationManager:
                 logger.info(f"Version updated: {current} -> {APP_VERSION}")
             else:
                 # Just update timestamp to mark migration complete
-                from database.migration_model import Migration, get_last_batch_number
-                if Migration.select().count() > 0:
+                if batch is None:
                     batch = get_last_batch_number()
-                    # Update the most recent migration's timestamp
-                    migrations = Migration.select().where(Migration.batch == batch)
-                    for m in migrations:
-                        m.applied_at = datetime.now()
-                        m.save()
+                if batch:
+                    # Update the most recent batch's timestamps in one statement
+                    Migration.update(applied_at=datetime.now()).where(
+                        Migration.batch == batch
+                    ).execute()
+
+            # Everything on disk is applied now; let later runs skip the scan.
+            # Not if a migration failed to load: it must be retried next time.
+            mtime = os.stat(self.migrations_dir).st_mtime_ns
+            cached = _migration_state_cache.get((self.migrations_dir, database.database))
+            if cached is not None and cached[0] == mtime and not cached[2]:
+                _write_migrations_stamp(mtime)
 
         except Exception as e:
             logger.error(f"Failed to update version record: {e}")
@@ -13,6 +13,8 @@ from peewee import (
     DateTimeField,
     IntegerField,
     Model,
+    OperationalError,
+    fn,
 )
 
 from database.connection import database
@@ -40,6 +42,17 @@ class Migration(Model):
         )
 
 
+class MigrationState(Model):
+    """Key/value state kept by the migration manager between runs."""
+
+    key = CharField(max_length=64, primary_key=True)
+    value = CharField(max_length=255)
+
+    class Meta:
+        database = database
+        table_name = "migration_state"
+
+
 def get_applied_migrations() -> set[str]:
     """Get set of applied migration names."""
     if database.is_closed():
@@ -66,8 +79,7 @@ def get_last_batch_number() -> int:
         database.connect()
 
     try:
-        last = Migration.select().order_by(Migration.batch.desc()).first()
-        return last.batch if last else 0
+        return Migration.select(fn.MAX(Migration.batch)).scalar() or 0
     except Exception:
         return 0
 
@@ -86,3 +98,37 @@ def delete_migration(name: str) -> bool:
 
     count = Migration.delete().where(Migration.name == name).execute()
     return count > 0
+
+
+def get_migration_state(key: str) -> Optional[str]:
+    """Get a stored migration state value.
+
+    Args:
+        key: State key
+
+    Returns:
+        The stored value, or None if unset or the table does not exist yet
+    """
+    if database.is_closed():
+        database.connect()
+
+    try:
+        row = MigrationState.get_or_none(MigrationState.key == key)
+    except OperationalError:
+        # Databases created before the migration_state table existed
+        return None
+    return row.value if row else None
+
+
+def set_migration_state(key: str, value: str) -> None:
+    """Store a migration state value, creating the table if needed.
+
+    Args:
+        key: State key
+        value: Value to store
+    """
+    if database.is_closed():
+        database.connect()
+
+    MigrationState.create_table(safe=True)
+    MigrationState.replace(key=key, value=value).execute()
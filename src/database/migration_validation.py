@@ -4,6 +4,7 @@ Provides pre-migration and post-migration validation to ensure
 database integrity and migration safety.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Tuple
 from pathlib import Path
 
@@ -21,6 +22,15 @@ class MigrationValidationError(Exception):
         super().__init__(message)
 
 
+def io_bound(check_func: callable) -> callable:
+    """Mark a check that does not use the database connection.
+
+    Such checks may run in a worker thread alongside the database checks.
+    """
+    check_func.io_bound = True
+    return check_func
+
+
 class MigrationValidator:
     """Validator for database migrations.
 
@@ -52,25 +62,72 @@ class MigrationValidator:
     def run_pre_checks(self) -> Tuple[bool, List[str]]:
         """Run all pre-migration validation checks.
 
+        Checks marked with @io_bound run in a worker thread while the
+        database checks run in order on the calling thread, which owns the
+        connection. Errors are reported in registration order.
+
         Returns:
             Tuple of (success: bool, errors: List[str])
         """
-        errors = []
+        io_checks = [c for c in self.pre_checks if getattr(c, "io_bound", False)]
+        results = {}
+
+        if io_checks:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = {
+                    id(check): executor.submit(self._run_pre_check, check)
+                    for check in io_checks
+                }
+                for check in self.pre_checks:
+                    if id(check) not in futures:
+                        results[id(check)] = self._run_pre_check(check)
+                for key, future in futures.items():
+                    results[key] = future.result()
+        else:
+            for check in self.pre_checks:
+                results[id(check)] = self._run_pre_check(check)
+
+        errors = [results[id(c)] for c in self.pre_checks if results[id(c)]]
+        return len(errors) == 0, errors
 
-        for check in self.pre_checks:
-            try:
-                check()
-                logger.info(f"Pre-check passed: {check.__name__}")
-            except MigrationValidationError as e:
-                error_msg = f"Pre-check failed ({e.check_name}): {e}"
-                logger.error(error_msg)
-                errors.append(error_msg)
-            except Exception as e:
-                error_msg = f"Pre-check error ({check.__name__}): {e}"
-                logger.error(error_msg)
-                errors.append(error_msg)
+    def _run_pre_check(self, check: callable) -> Optional[str]:
+        """Run one pre-migration check.
 
-        return len(errors) == 0, errors
+        Returns:
+            Error message, or None if the check passed
+        """
+        try:
+            check()
+            logger.info(f"Pre-check passed: {check.__name__}")
+            return None
+        except MigrationValidationError as e:
+            error_msg = f"Pre-check failed ({e.check_name}): {e}"
+        except Exception as e:
+            error_msg = f"Pre-check error ({check.__name__}): {e}"
+        logger.error(error_msg)
+        return error_msg
+
+    def run_pre_checks_batched(self) -> Tuple[bool, List[str]]:
+        """Run all pre-migration checks in a single database transaction.
+
+        The checks share one connection and one IMMEDIATE transaction, so the
+        write lock is taken once and anything they create (e.g. the version
+        table) is committed once. Checks' own transactions become savepoints.
+
+        Returns:
+            Tuple of (success: bool, errors: List[str])
+        """
+        try:
+            if database.is_closed():
+                database.connect()
+
+            with database.atomic("IMMEDIATE"):
+                return self.run_pre_checks()
+
+        except Exception as e:
+            error_msg = f"Pre-check error (transaction): {e}"
+            logger.error(error_msg)
+            return False, [error_msg]
 
     def run_post_checks(self) -> Tuple[bool, List[str]]:
         """Run all post-migration validation checks.
@@ -110,19 +167,12 @@ def check_database_writable() -> None:
         if database.is_closed():
             database.connect()
 
-        # Try to create a test table
-        from peewee import Model, CharField
-
-        class TestTable(Model):
-            name = CharField()
-
-            class Meta:
-                database = database
-                table_name = "_migration_test_write"
-
+        # Take the write lock and attempt a write, then roll it back: nothing
+        # is committed, and a read-only database fails on the CREATE
         try:
-            database.create_tables([TestTable], safe=True)
-            TestTable.drop_table()
+            with database.atomic("IMMEDIATE") as txn:
+                database.execute_sql("CREATE TABLE IF NOT EXISTS _migration_test_write (name TEXT)")
+                txn.rollback()
         except Exception as e:
             raise MigrationValidationError(
                 f"Database is not writable: {e}",
@@ -138,6 +188,7 @@ def check_database_writable() -> None:
         )
 
 
+@io_bound
 def check_disk_space(required_mb: int = 50) -> None:
     """Check that there's enough disk space for backup and migration.
 
@@ -268,7 +319,7 @@ def validate_before_migration() -> Tuple[bool, List[str]]:
         Tuple of (success: bool, errors: List[str])
     """
     validator = get_validator()
-    return validator.run_pre_checks()
+    return validator.run_pre_checks_batched()
 
 
 def validate_after_migration() -> Tuple[bool, List[str]]:
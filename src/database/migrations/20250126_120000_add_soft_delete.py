@@ -25,6 +25,31 @@ from utils.logging_config import setup_logging, get_logger
 setup_logging(level="INFO", enable_console=True, enable_file=True)
 logger = get_logger(__name__)
 
+# Connection-level tuning applied before the schema changes; this script
+# connects without init_database, so journaling is set here too
+MIGRATION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=60000",
+)
+
+SOFT_DELETE_TABLES = ("employees", "caces", "medical_visits", "online_trainings")
+
+SOFT_DELETE_COLUMNS = (
+    ("deleted_at", "TIMESTAMP NULL"),
+    ("deleted_by", "TEXT NULL"),
+    ("deletion_reason", "TEXT NULL"),
+)
+
+
+def _existing_columns(cursor, table: str) -> set[str]:
+    """Return the column names of a table (empty if it does not exist)."""
+    cursor.execute(f"PRAGMA table_info({table})")
+    return {row[1] for row in cursor.fetchall()}
+
 
 def migrate():
     """
@@ -47,72 +72,28 @@ def migrate():
 
         cursor = database.cursor()
 
-        # Employees table
-        logger.info("Adding soft delete fields to employees table...")
+        for pragma in MIGRATION_PRAGMAS:
+            cursor.execute(pragma)
 
-        employee_columns = [
-            ("deleted_at", "TIMESTAMP NULL"),
-            ("deleted_by", "TEXT NULL"),
-            ("deletion_reason", "TEXT NULL"),
-        ]
+        # Start transaction: all column additions commit together
+        database.begin()
 
-        for column_name, column_type in employee_columns:
-            try:
-                cursor.execute(
-                    f"ALTER TABLE employees ADD COLUMN {column_name} {column_type}"
-                )
-                logger.info(f"Added column: employees.{column_name}")
-            except Exception as e:
-                # Column might already exist
-                if "duplicate column" in str(e).lower():
-                    logger.info(f"Column already exists: employees.{column_name}")
-                else:
-                    logger.warning(f"Failed to add column {column_name}: {e}")
-
-        # CACES table
-        logger.info("Adding soft delete fields to caces table...")
-
-        for column_name, column_type in employee_columns:
-            try:
-                cursor.execute(
-                    f"ALTER TABLE caces ADD COLUMN {column_name} {column_type}"
-                )
-                logger.info(f"Added column: caces.{column_name}")
-            except Exception as e:
-                if "duplicate column" in str(e).lower():
-                    logger.info(f"Column already exists: caces.{column_name}")
-                else:
-                    logger.warning(f"Failed to add column {column_name}: {e}")
-
-        # Medical visits table
-        logger.info("Adding soft delete fields to medical_visits table...")
-
-        for column_name, column_type in employee_columns:
-            try:
-                cursor.execute(
-                    f"ALTER TABLE medical_visits ADD COLUMN {column_name} {column_type}"
-                )
-                logger.info(f"Added column: medical_visits.{column_name}")
-            except Exception as e:
-                if "duplicate column" in str(e).lower():
-                    logger.info(f"Column already exists: medical_visits.{column_name}")
-                else:
-                    logger.warning(f"Failed to add column {column_name}: {e}")
-
-        # Online trainings table
-        logger.info("Adding soft delete fields to online_trainings table...")
-
-        for column_name, column_type in employee_columns:
-            try:
+        for table in SOFT_DELETE_TABLES:
+            logger.info(f"Adding soft delete fields to {table} table...")
+
+            existing = _existing_columns(cursor, table)
+            if not existing:
+                logger.warning(f"Table not found, skipping: {table}")
+                continue
+
+            for column_name, column_type in SOFT_DELETE_COLUMNS:
+                if column_name in existing:
+                    logger.info(f"Column already exists: {table}.{column_name}")
+                    continue
                 cursor.execute(
-                    f"ALTER TABLE online_trainings ADD COLUMN {column_name} {column_type}"
+                    f"ALTER TABLE {table} ADD COLUMN {column_name} {column_type}"
                 )
-                logger.info(f"Added column: online_trainings.{column_name}")
-            except Exception as e:
-                if "duplicate column" in str(e).lower():
-                    logger.info(f"Column already exists: online_trainings.{column_name}")
-                else:
-                    logger.warning(f"Failed to add column {column_name}: {e}")
+                logger.info(f"Added column: {table}.{column_name}")
 
         # Commit changes
         database.commit()
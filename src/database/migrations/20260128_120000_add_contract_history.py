@@ -9,9 +9,10 @@ Migrates existing employee data to create initial contracts.
 
 import uuid
 from datetime import datetime
+from typing import Optional
 
 from database.connection import database
-from database.migrations.base import BaseMigration
+from database.migrations.base import BaseMigration, get_existing_tables
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -54,14 +55,6 @@ class AddContractHistory(BaseMigration):
             )
         """)
 
-        # Create indexes for contracts
-        logger.info("Creating indexes for contracts table...")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contracts_employee_start ON contracts(employee_id, start_date)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contracts_end_date ON contracts(end_date)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contracts_status ON contracts(status)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contracts_position ON contracts(position)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contracts_department ON contracts(department)")
-
         # Create contract_amendments table
         logger.info("Creating contract_amendments table...")
         cursor.execute("""
@@ -81,34 +74,42 @@ class AddContractHistory(BaseMigration):
             )
         """)
 
-        # Create indexes for contract_amendments
-        logger.info("Creating indexes for contract_amendments table...")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contract_amendments_contract_date ON contract_amendments(contract_id, amendment_date)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contract_amendments_type ON contract_amendments(amendment_type)")
-
         # Migrate existing employees to initial contracts
         logger.info("Migrating existing employees to contracts...")
         cursor.execute("""
+            SELECT id, contract_type, entry_date, role, created_at
+            FROM employees
+            WHERE deleted_at IS NULL
+        """)
+        # IDs generated in Python (same hex format as UUIDField) instead of
+        # calling randomblob()/hex() per row inside SQLite
+        contracts = [
+            (uuid.uuid4().hex, employee_id, contract_type, entry_date, role, created_at, created_at)
+            for employee_id, contract_type, entry_date, role, created_at in cursor.fetchall()
+        ]
+        cursor.executemany("""
             INSERT INTO contracts (
                 id, employee_id, contract_type, start_date, end_date,
                 position, department, status, created_at, updated_at
             )
-            SELECT
-                lower(hex(randomblob(16))),
-                id,
-                contract_type,
-                entry_date,
-                NULL,
-                role,
-                'Logistics',
-                'active',
-                created_at,
-                created_at
-            FROM employees
-            WHERE deleted_at IS NULL
-        """)
+            VALUES (?, ?, ?, ?, NULL, ?, 'Logistics', 'active', ?, ?)
+        """, contracts)
 
-        database.commit()
+        # Create indexes for contracts after the backfill: one sorted build
+        # over the final rows instead of maintaining five B-trees per insert
+        logger.info("Creating indexes for contracts table...")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contracts_employee_start ON contracts(employee_id, start_date)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contracts_end_date ON contracts(end_date)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contracts_status ON contracts(status)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contracts_position ON contracts(position)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contracts_department ON contracts(department)")
+
+        # Create indexes for contract_amendments
+        logger.info("Creating indexes for contract_amendments table...")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contract_amendments_contract_date ON contract_amendments(contract_id, amendment_date)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contract_amendments_type ON contract_amendments(amendment_type)")
+
+        # Committed by the transaction run_migration() wraps around up()
         logger.info("Contract history migration completed successfully")
 
     def down(self) -> None:
@@ -121,21 +122,15 @@ class AddContractHistory(BaseMigration):
         logger.info("Dropping contracts table...")
         cursor.execute("DROP TABLE IF EXISTS contracts")
 
-        database.commit()
+        # Committed by the transaction rollback_migration() wraps around down()
         logger.info("Contract history rollback completed")
 
-    def pre_check(self) -> bool:
+    def pre_check(self, existing_tables: Optional[set[str]] = None) -> bool:
         """Verify safe to migrate."""
-        cursor = database.cursor()
+        if existing_tables is None:
+            existing_tables = get_existing_tables()
 
-        # Check if contracts table already exists
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='contracts'
-        """)
-        result = cursor.fetchone()
-
-        if result:
+        if "contracts" in existing_tables:
             logger.warning("Contracts table already exists, skipping migration")
             return False
 
@@ -145,21 +140,14 @@ class AddContractHistory(BaseMigration):
         """Verify migration success."""
         cursor = database.cursor()
 
-        # Check contracts table exists
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='contracts'
-        """)
-        if not cursor.fetchone():
+        # One scan covers both tables; it must be fresh since up() created them
+        tables = get_existing_tables()
+
+        if "contracts" not in tables:
             logger.error("Contracts table was not created")
             return False
 
-        # Check contract_amendments table exists
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='contract_amendments'
-        """)
-        if not cursor.fetchone():
+        if "contract_amendments" not in tables:
             logger.error("Contract amendments table was not created")
             return False
 
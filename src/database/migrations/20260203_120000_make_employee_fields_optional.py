@@ -25,6 +25,53 @@ from utils.config import get_database_path, ensure_database_directory
 setup_logging(level="INFO", enable_console=True, enable_file=True)
 logger = get_logger(__name__)
 
+# Connection-level tuning for the table rewrite
+# (journal_mode and synchronous are already set by init_database)
+MIGRATION_PRAGMAS = (
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=60000",
+)
+
+# Column order of employees_new, matching a table created by the models
+EMPLOYEE_COLUMNS = (
+    "id", "external_id", "first_name", "last_name", "current_status",
+    "workspace", "role", "contract_type", "entry_date", "avatar_path",
+    "phone", "email", "created_at", "updated_at", "deleted_at",
+    "deleted_by", "deletion_reason",
+)
+
+# Secondary indexes on employees: (index name, column)
+EMPLOYEE_INDEXES = (
+    ("idx_employees_external_id", "external_id"),
+    ("idx_employees_current_status", "current_status"),
+    ("idx_employees_workspace", "workspace"),
+    ("idx_employees_role", "role"),
+    ("idx_employees_contract_type", "contract_type"),
+    ("idx_employees_deleted_at", "deleted_at"),
+)
+
+
+def _drop_employee_indexes(cursor) -> None:
+    """Drop the secondary indexes so they are only built after the copy."""
+    for index_name, _ in EMPLOYEE_INDEXES:
+        cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+def _create_employee_indexes(cursor) -> None:
+    """Build the secondary indexes and refresh the planner statistics.
+
+    Runs inside the caller's transaction, so all indexes commit together.
+    """
+    for index_name, column in EMPLOYEE_INDEXES:
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON employees ({column})"
+        )
+        logger.info(f"Created index: {index_name}")
+
+    cursor.execute("ANALYZE employees")
+
 
 def migrate():
     """
@@ -64,6 +111,9 @@ def migrate():
 
         cursor = database.cursor()
 
+        for pragma in MIGRATION_PRAGMAS:
+            cursor.execute(pragma)
+
         # Check if contract_type is already nullable (migration already run)
         cursor.execute("PRAGMA table_info(employees)")
         columns = cursor.fetchall()
@@ -91,6 +141,8 @@ def migrate():
         # Start transaction
         database.begin()
 
+        _drop_employee_indexes(cursor)
+
         # Create new employees table with nullable columns
         logger.info("Creating new employees table with nullable columns...")
 
@@ -121,20 +173,17 @@ def migrate():
         # Copy data from old table to new table
         logger.info("Copying existing data...")
 
-        cursor.execute("""
-            INSERT INTO employees_new (
-                id, external_id, first_name, last_name, current_status,
-                workspace, role, contract_type, entry_date, avatar_path,
-                phone, email, created_at, updated_at, deleted_at,
-                deleted_by, deletion_reason
+        if tuple(col[1] for col in columns) == EMPLOYEE_COLUMNS:
+            # Same column order: SELECT * lets SQLite copy whole records
+            # (its INSERT ... SELECT transfer optimization)
+            cursor.execute("INSERT INTO employees_new SELECT * FROM employees")
+        else:
+            # Columns added later by ALTER TABLE sit in a different order
+            column_list = ", ".join(EMPLOYEE_COLUMNS)
+            cursor.execute(
+                f"INSERT INTO employees_new ({column_list}) "
+                f"SELECT {column_list} FROM employees"
             )
-            SELECT
-                id, external_id, first_name, last_name, current_status,
-                workspace, role, contract_type, entry_date, avatar_path,
-                phone, email, created_at, updated_at, deleted_at,
-                deleted_by, deletion_reason
-            FROM employees
-        """)
 
         row_count = cursor.rowcount
         logger.info(f"Copied {row_count} employee records")
@@ -150,21 +199,7 @@ def migrate():
         # Recreate indexes
         logger.info("Recreating indexes...")
 
-        indexes = [
-            ("idx_employees_external_id", "CREATE INDEX idx_employees_external_id ON employees (external_id)"),
-            ("idx_employees_current_status", "CREATE INDEX idx_employees_current_status ON employees (current_status)"),
-            ("idx_employees_workspace", "CREATE INDEX idx_employees_workspace ON employees (workspace)"),
-            ("idx_employees_role", "CREATE INDEX idx_employees_role ON employees (role)"),
-            ("idx_employees_contract_type", "CREATE INDEX idx_employees_contract_type ON employees (contract_type)"),
-            ("idx_employees_deleted_at", "CREATE INDEX idx_employees_deleted_at ON employees (deleted_at)"),
-        ]
-
-        for index_name, sql in indexes:
-            try:
-                cursor.execute(sql)
-                logger.info(f"Created index: {index_name}")
-            except Exception as e:
-                logger.warning(f"Index {index_name} may already exist: {e}")
+        _create_employee_indexes(cursor)
 
         # Commit transaction
         database.commit()
@@ -240,6 +275,8 @@ def rollback():
         # Start transaction
         database.begin()
 
+        _drop_employee_indexes(cursor)
+
         # Create new table with required columns
         logger.info("Creating new employees table with required columns...")
 
@@ -287,15 +324,7 @@ def rollback():
         cursor.execute("ALTER TABLE employees_new RENAME TO employees")
 
         # Recreate indexes
-        for index_name, sql in [
-            ("idx_employees_external_id", "CREATE INDEX idx_employees_external_id ON employees (external_id)"),
-            ("idx_employees_current_status", "CREATE INDEX idx_employees_current_status ON employees (current_status)"),
-            ("idx_employees_workspace", "CREATE INDEX idx_employees_workspace ON employees (workspace)"),
-            ("idx_employees_role", "CREATE INDEX idx_employees_role ON employees (role)"),
-            ("idx_employees_contract_type", "CREATE INDEX idx_employees_contract_type ON employees (contract_type)"),
-            ("idx_employees_deleted_at", "CREATE INDEX idx_employees_deleted_at ON employees (deleted_at)"),
-        ]:
-            cursor.execute(sql)
+        _create_employee_indexes(cursor)
 
         database.commit()
         logger.info("Rollback completed successfully")
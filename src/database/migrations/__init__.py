@@ -27,8 +27,11 @@ from database.migrations.base import (
     MigrationError,
     RollbackError,
     backup_database,
+    call_pre_check,
     discover_migrations,
+    get_existing_tables,
     get_pending_migrations,
+    init_migration_logging,
     restore_database,
     rollback_migration,
     run_migration,
@@ -40,8 +43,11 @@ __all__ = [
     "MigrationError",
     "RollbackError",
     "backup_database",
+    "call_pre_check",
     "discover_migrations",
+    "get_existing_tables",
     "get_pending_migrations",
+    "init_migration_logging",
     "restore_database",
     "rollback_migration",
     "run_migration",
@@ -10,6 +10,7 @@ Migration Lifecycle:
 """
 
 import importlib
+import inspect
 import re
 import shutil
 from abc import ABC, abstractmethod
@@ -26,10 +27,17 @@ from database.migration_model import (
 )
 from utils.logging_config import setup_logging, get_logger
 
-# Setup logging
-setup_logging(level="INFO", enable_console=True, enable_file=False)
 logger = get_logger(__name__)
 
+# Logging is configured on first use rather than at import, so importing the
+# migration framework does not replace the application's handlers.
+# None until configured, then whether the file handler is enabled.
+_logging_file_enabled: Optional[bool] = None
+
+# Migration classes already loaded in this process:
+# migration file -> (file mtime_ns, migration class)
+_migration_class_cache: dict[Path, tuple[int, Optional[type]]] = {}
+
 
 class MigrationError(Exception):
     """Base exception for migration errors."""
@@ -76,10 +84,14 @@ class BaseMigration(ABC):
         """
         pass
 
-    def pre_check(self) -> bool:
+    def pre_check(self, existing_tables: Optional[set[str]] = None) -> bool:
         """Run pre-migration validation. Return True if safe to proceed.
 
         Override this method to add custom validation logic.
+
+        Args:
+            existing_tables: Table names from a single sqlite_master scan
+                shared across a batch; None if the caller did not scan
         """
         return True
 
@@ -91,6 +103,49 @@ class BaseMigration(ABC):
         return True
 
 
+def init_migration_logging(enable_file: bool = False) -> None:
+    """Configure logging for migrations once per process.
+
+    A later call asking for file logging upgrades a console-only setup.
+
+    Args:
+        enable_file: Also write logs to the application log file
+    """
+    global _logging_file_enabled
+    if _logging_file_enabled is None or (enable_file and not _logging_file_enabled):
+        setup_logging(level="INFO", enable_console=True, enable_file=enable_file)
+        _logging_file_enabled = enable_file
+
+
+def call_pre_check(
+    migration: BaseMigration, existing_tables: Optional[set[str]] = None
+) -> bool:
+    """Run a migration's pre_check(), passing existing_tables if it takes them.
+
+    Migrations written before pre_check() took existing_tables override it
+    as pre_check(self); those are called without the argument.
+
+    Args:
+        migration: Migration instance to check
+        existing_tables: Optional table names from get_existing_tables()
+
+    Returns:
+        Result of pre_check()
+    """
+    if existing_tables is not None:
+        parameters = inspect.signature(migration.pre_check).parameters
+        if "existing_tables" in parameters or any(
+            p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()
+        ):
+            return migration.pre_check(existing_tables=existing_tables)
+    return migration.pre_check()
+
+
+def get_existing_tables() -> set[str]:
+    """Return the names of all tables, read in one sqlite_master scan."""
+    return set(database.get_tables())
+
+
 def backup_database(db_path: Path) -> Path:
     """Create a backup of the database before migration.
 
@@ -100,6 +155,7 @@ def backup_database(db_path: Path) -> Path:
     Returns:
         Path to backup file
     """
+    init_migration_logging()
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_dir = db_path.parent / "backups"
     backup_dir.mkdir(exist_ok=True)
@@ -121,6 +177,7 @@ def restore_database(backup_path: Path, db_path: Path) -> None:
         backup_path: Path to backup file
         db_path: Target database path
     """
+    init_migration_logging()
     logger.info(f"Restoring database from: {backup_path}")
     shutil.copy2(backup_path, db_path)
     logger.info(f"Database restored successfully")
@@ -151,6 +208,7 @@ def discover_migrations(migrations_dir: Path) -> list[Path]:
     Returns:
         Sorted list of migration file paths
     """
+    init_migration_logging()
     if not migrations_dir.exists():
         logger.warning(f"Migrations directory not found: {migrations_dir}")
         return []
@@ -171,15 +229,60 @@ def discover_migrations(migrations_dir: Path) -> list[Path]:
     return migration_files
 
 
-def get_pending_migrations(migrations_dir: Path) -> list[BaseMigration]:
+def _load_migration_class(migration_file: Path) -> Optional[type]:
+    """Import a migration file and return its BaseMigration subclass.
+
+    Classes are reused while the file's mtime is unchanged; an edited file
+    is reloaded.
+
+    Args:
+        migration_file: Path to the migration file
+
+    Returns:
+        Migration class, or None if the module defines none
+    """
+    mtime = migration_file.stat().st_mtime_ns
+    cached = _migration_class_cache.get(migration_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    # Dynamic import: migrations.add_missing_indexes -> AddMissingIndexes
+    module = importlib.import_module(f"database.migrations.{migration_file.stem}")
+    if cached is not None:
+        module = importlib.reload(module)
+
+    # Get migration class (should be the only class inheriting from BaseMigration)
+    migration_class = None
+    for attr_name in dir(module):
+        attr = getattr(module, attr_name)
+        if (
+            isinstance(attr, type)
+            and issubclass(attr, BaseMigration)
+            and attr is not BaseMigration
+        ):
+            migration_class = attr
+            break
+
+    # Modules without a migration class are cached too, so they are not
+    # re-imported on every scan
+    _migration_class_cache[migration_file] = (mtime, migration_class)
+    return migration_class
+
+
+def get_pending_migrations(
+    migrations_dir: Path, failed: Optional[list[str]] = None
+) -> list[BaseMigration]:
     """Get list of pending (not yet applied) migrations.
 
     Args:
         migrations_dir: Path to migrations directory
+        failed: Optional list that receives the names of migrations that
+            could not be loaded and were skipped
 
     Returns:
         List of migration instances that need to be applied
     """
+    init_migration_logging()
     applied = get_applied_migrations()
     migration_files = discover_migrations(migrations_dir)
 
@@ -200,39 +303,31 @@ def get_pending_migrations(migrations_dir: Path) -> list[BaseMigration]:
 
         # Import and instantiate migration
         try:
-            # Dynamic import: migrations.add_missing_indexes -> AddMissingIndexes
-            module_name = f"database.migrations.{migration_name}"
-
-            # Import module
-            import importlib
-            module = importlib.import_module(module_name)
-
-            # Get migration class (should be the only class inheriting from BaseMigration)
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (
-                    isinstance(attr, type)
-                    and issubclass(attr, BaseMigration)
-                    and attr is not BaseMigration
-                ):
-                    migration_instance = attr()
-                    pending.append(migration_instance)
-                    break
+            migration_class = _load_migration_class(migration_file)
+            if migration_class is not None:
+                pending.append(migration_class())
 
         except Exception as e:
             logger.error(f"Failed to load migration {migration_name}: {e}")
+            if failed is not None:
+                failed.append(migration_name)
             # Skip this migration and continue with others
             continue
 
     return pending
 
 
-def run_migration(migration: BaseMigration, batch: int) -> bool:
+def run_migration(
+    migration: BaseMigration,
+    batch: int,
+    existing_tables: Optional[set[str]] = None,
+) -> bool:
     """Run a single migration.
 
     Args:
         migration: Migration instance to run
         batch: Batch number for this migration run
+        existing_tables: Optional table names to hand to pre_check()
 
     Returns:
         True if successful, False otherwise
@@ -240,10 +335,11 @@ def run_migration(migration: BaseMigration, batch: int) -> bool:
     Raises:
         MigrationError: If migration fails
     """
+    init_migration_logging()
     logger.info(f"Running migration: {migration.name}")
 
     # Pre-migration check
-    if not migration.pre_check():
+    if not call_pre_check(migration, existing_tables):
         raise MigrationError(f"Pre-check failed for migration: {migration.name}")
 
     # Connect to database if closed
@@ -251,8 +347,9 @@ def run_migration(migration: BaseMigration, batch: int) -> bool:
         database.connect()
 
     try:
-        # Start transaction
-        with database.atomic():
+        # One IMMEDIATE transaction for the whole migration: the write lock is
+        # taken up front and all DDL and backfill statements share one commit
+        with database.atomic("IMMEDIATE"):
             # Apply migration
             migration.up()
             logger.info(f"Migration up() completed: {migration.name}")
@@ -290,6 +387,7 @@ def rollback_migration(migration: BaseMigration) -> bool:
     Raises:
         RollbackError: If rollback fails
     """
+    init_migration_logging()
     logger.info(f"Rolling back migration: {migration.name}")
 
     # Connect to database if closed
@@ -297,8 +395,8 @@ def rollback_migration(migration: BaseMigration) -> bool:
         database.connect()
 
     try:
-        # Start transaction
-        with database.atomic():
+        # Single IMMEDIATE transaction, committed once on exit
+        with database.atomic("IMMEDIATE"):
             # Rollback migration
             migration.down()
             logger.info(f"Migration down() completed: {migration.name}")
@@ -21,6 +21,9 @@ from .constants import (
     VisitType,
 )
 
+# Allowed external ID characters (alphanumeric, underscore, hyphen)
+EXTERNAL_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
 # =============================================================================
 # EXCEPTIONS
 # =============================================================================
@@ -147,8 +150,7 @@ def validate_external_id(external_id: str) -> str:
             )
 
     # Check for valid characters (alphanumeric, underscore, hyphen)
-    pattern = r"^[A-Za-z0-9_-]+$"
-    if not re.match(pattern, external_id):
+    if not EXTERNAL_ID_PATTERN.match(external_id):
         raise ValidationError(
             field="external_id",
             value=external_id,
@@ -1,9 +1,10 @@
 """Excel import logic for bulk employee import."""
 
+import uuid
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 try:
     from openpyxl import load_workbook
@@ -13,11 +14,115 @@ except ImportError:
 
 from database.connection import database
 from employee.models import Employee
+from employee.validators import ValidationError as ModelValidationError
+from employee.validators import validate_entry_date, validate_external_id
 from utils.validation import InputValidator, ValidationError
 from ui_ctk.constants import (
     CONTRACT_TYPE_CHOICES,
 )
 
+# Accepted date formats, tried in order when the fast path does not apply
+DATE_FORMATS = ("%d/%m/%Y", "%Y-%m-%d")
+
+# Employee columns written by raw_bulk_insert(), in statement order
+RAW_INSERT_FIELDS = (
+    "first_name",
+    "last_name",
+    "email",
+    "phone",
+    "external_id",
+    "current_status",
+    "workspace",
+    "role",
+    "contract_type",
+    "entry_date",
+)
+
+RAW_INSERT_SQL = "INSERT INTO employees (id, created_at, updated_at, {}) VALUES ({})".format(
+    ", ".join(RAW_INSERT_FIELDS), ", ".join("?" * (len(RAW_INSERT_FIELDS) + 3))
+)
+
+# Connection-level tuning for the duration of a raw bulk insert; previous
+# values are restored afterwards (journal_mode and synchronous are already
+# set by init_database)
+BULK_INSERT_PRAGMAS = {
+    "temp_store": "MEMORY",
+    "cache_size": -65536,
+    "mmap_size": 268435456,
+}
+
+
+def validate_model_fields(employee_data: Dict[str, Any]) -> None:
+    """
+    Run the checks Employee.before_save() applies, for rows written without save().
+
+    Validated values are written back into employee_data.
+
+    Args:
+        employee_data: Employee field dictionary
+
+    Raises:
+        employee.validators.ValidationError: If external_id or entry_date is invalid
+    """
+    if employee_data.get("external_id"):
+        employee_data["external_id"] = validate_external_id(employee_data["external_id"])
+    if employee_data.get("entry_date"):
+        employee_data["entry_date"] = validate_entry_date(employee_data["entry_date"])
+
+
+def raw_bulk_insert(rows: List[Dict[str, Any]]) -> int:
+    """
+    Insert employee rows with sqlite3 executemany().
+
+    Bypasses peewee's per-row query building, so Employee.save() does not
+    run: rows go through validate_model_fields() instead, and values are
+    converted with the model fields' db_value(). Uses the peewee connection
+    so the insert shares its transaction handling.
+
+    Args:
+        rows: Employee field dictionaries, as built by ExcelImporter
+
+    Returns:
+        Number of rows inserted
+
+    Raises:
+        employee.validators.ValidationError: If a row fails validation;
+            nothing is inserted
+    """
+    if not rows:
+        return 0
+
+    for row in rows:
+        validate_model_fields(row)
+
+    fields = Employee._meta.fields
+    columns = [fields[name] for name in RAW_INSERT_FIELDS]
+    now = datetime.now()
+    created = fields["created_at"].db_value(now)
+    updated = fields["updated_at"].db_value(now)
+    params = [
+        [fields["id"].db_value(uuid.uuid4()), created, updated]
+        + [field.db_value(row.get(field.name)) for field in columns]
+        for row in rows
+    ]
+
+    previous = {
+        name: database.execute_sql(f"PRAGMA {name}").fetchone()[0]
+        for name in BULK_INSERT_PRAGMAS
+    }
+    try:
+        for name, value in BULK_INSERT_PRAGMAS.items():
+            database.execute_sql(f"PRAGMA {name}={value}")
+
+        with database.atomic():
+            database.connection().executemany(RAW_INSERT_SQL, params)
+    finally:
+        # The connection is long-lived; leave it as the app configured it
+        for name, value in previous.items():
+            database.execute_sql(f"PRAGMA {name}={value}")
+
+    return len(params)
+
 
 @dataclass
 class ImportError:
@@ -96,6 +201,7 @@ class ExcelImporter:
 
     # Required columns in Excel file
     REQUIRED_COLUMNS = ["First Name", "Last Name", "Status", "Workspace", "Role", "Contract", "Entry Date"]
+    REQUIRED_COLUMNS_SET = frozenset(REQUIRED_COLUMNS)
 
     # Optional columns
     OPTIONAL_COLUMNS = ["Email", "Phone", "External ID"]
@@ -114,6 +220,7 @@ class ExcelImporter:
         self.workbook = None
         self.worksheet = None
         self.headers = []
+        self._col_index = {}
         self.data_rows = []
 
     def validate_file(self) -> Tuple[bool, Optional[str]]:
@@ -140,7 +247,7 @@ class ExcelImporter:
 
         # Try to open file
         try:
-            self.workbook = load_workbook(self.file_path, read_only=True, data_only=True)
+            self.workbook = load_workbook(self.file_path, read_only=True, data_only=True, keep_links=False)
         except Exception as e:
             return False, f"Cannot open file: {str(e)}"
 
@@ -151,40 +258,59 @@ class ExcelImporter:
         # Use first worksheet
         self.worksheet = self.workbook.active
 
+        # Load headers from first row; iterating avoids relying on the
+        # sheet dimension record, which streaming writers may omit
+        header_row = next(self.worksheet.iter_rows(min_row=1, max_row=1, values_only=True), None)
+
         # Check if worksheet has data
-        if self.worksheet.max_row < 1:
+        if header_row is None:
             return False, "File is empty (no data rows)"
 
-        # Load headers from first row
-        self.headers = [
-            self._get_cell_value(row_idx=1, col_idx=col_idx) for col_idx in range(1, self.worksheet.max_column + 1)
-        ]
+        # Strip the template's " *" required-marker once here, not per cell
+        self.headers = [self._normalize_header(value) for value in header_row]
+        self._col_index = {name: idx for idx, name in enumerate(self.headers) if name}
 
         # Check for required columns
-        missing_columns = set(self.REQUIRED_COLUMNS) - set(self.headers)
+        missing_columns = self.REQUIRED_COLUMNS_SET.difference(self.headers)
         if missing_columns:
             return False, f"Missing required columns: {', '.join(missing_columns)}"
 
         return True, None
 
-    def _get_cell_value(self, row_idx: int, col_idx: int) -> Optional[str]:
+    @staticmethod
+    def _normalize_value(value: Any) -> Optional[str]:
         """
-        Get cell value as string.
+        Convert a raw cell value to a stripped string.
 
         Args:
-            row_idx: Row index (1-indexed)
-            col_idx: Column index (1-indexed)
+            value: Raw cell value
 
         Returns:
             Cell value as string or None if empty
         """
-        cell = self.worksheet.cell(row_idx, col_idx)
-        if cell.value is None:
+        if value is None:
             return None
 
-        value = str(cell.value).strip()
+        value = str(value).strip()
         return value if value else None
 
+    @classmethod
+    def _normalize_header(cls, value: Any) -> Optional[str]:
+        """
+        Convert a raw header cell to a column name without the required-marker.
+
+        Args:
+            value: Raw header cell value
+
+        Returns:
+            Column name (e.g. "First Name" for "First Name *") or None if empty
+        """
+        name = cls._normalize_value(value)
+        if name is None:
+            return None
+
+        return name.rstrip(" *") or None
+
     def close(self):
         """
         Close the workbook and release resources.
@@ -207,28 +333,44 @@ class ExcelImporter:
                 'raw_row': dict of raw values
             }
         """
+        self.data_rows = list(self.iter_rows())
+        return self.data_rows
+
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield row dictionaries from the Excel file.
+
+        Rows are streamed as plain value tuples, so no Cell objects are
+        built. Yields the same dictionaries as parse_file().
+
+        Yields:
+            Row dictionary for each row containing data
+        """
         if not self.worksheet:
             raise RuntimeError("File not validated. Call validate_file() first.")
 
-        rows = []
+        # Column positions are resolved once per file from the header row
+        columns = tuple(self._col_index.items())
+        width = len(self.headers)
 
         # Start from row 2 (skip header)
-        for row_idx in range(2, self.worksheet.max_row + 1):
+        for row_idx, values in enumerate(self.worksheet.iter_rows(min_row=2, values_only=True), start=2):
+            # Cells past the end of a short row are empty
+            if len(values) < width:
+                values = values + (None,) * (width - len(values))
+
             row_data = {}
             raw_row = {}
 
-            for col_idx, header in enumerate(self.headers, start=1):
-                value = self._get_cell_value(row_idx, col_idx)
+            for header, idx in columns:
+                value = self._normalize_value(values[idx])
                 if value:
                     row_data[header] = value
                 raw_row[header] = value
 
             # Only include rows that have at least some data
             if row_data:
-                rows.append({"row_num": row_idx, "data": row_data, "raw_row": raw_row})
-
-        self.data_rows = rows
-        return rows
+                yield {"row_num": row_idx, "data": row_data, "raw_row": raw_row}
 
     def preview(self, max_rows: int = 3) -> Dict[str, Any]:
         """
@@ -268,16 +410,21 @@ class ExcelImporter:
             "detected_issues": issues,
         }
 
-    def import_employees(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> ImportResult:
+    def import_employees(
+        self, progress_callback: Optional[Callable[[int, int], None]] = None, fast: bool = False
+    ) -> ImportResult:
         """
         Import employees from parsed Excel data.
 
         Processes all parsed rows in batches with transaction support.
-        Detects duplicates and collects errors.
+        A batch that fails to insert is retried row by row, so errors are
+        reported per row. Detects duplicates and collects errors.
 
         Args:
             progress_callback: Optional callback for progress updates
                               Called with (current_row, total_rows)
+            fast: Write batches with raw_bulk_insert() instead of
+                  Employee.insert_many()
 
         Returns:
             ImportResult with detailed statistics
@@ -285,6 +432,9 @@ class ExcelImporter:
         if not self.data_rows:
             self.parse_file()
 
+        # All rows are in memory now; release the file lock before importing
+        self.close()
+
         start_time = datetime.now()
         result = ImportResult(file_path=self.file_path)
         result.total_rows = len(self.data_rows)
@@ -292,63 +442,69 @@ class ExcelImporter:
         if progress_callback:
             progress_callback(0, result.total_rows)
 
+        # External IDs accepted so far, so duplicates within the file are
+        # caught before they reach the database
+        seen_external_ids = set()
+
         # Process in batches
         for batch_start in range(0, result.total_rows, self.BATCH_SIZE):
             batch_end = min(batch_start + self.BATCH_SIZE, result.total_rows)
             batch = self.data_rows[batch_start:batch_end]
 
-            # Process batch with transaction
+            # Validate the batch first, then write the valid rows in one statement
+            pending = []
+            for row_info in batch:
+                employee_data, error = self._prepare_row(row_info, seen_external_ids)
+                if error:
+                    result.failed += 1
+                    result.errors.append(error)
+                else:
+                    pending.append((row_info["row_num"], employee_data))
+
             try:
-                with database.atomic():
-                    for row_info in batch:
-                        success, error = self._import_single_row(row_info)
-
-                        if success:
-                            result.successful += 1
-                        else:
-                            result.failed += 1
-                            if error:
-                                result.errors.append(error)
-
-                # Update progress
-                if progress_callback:
-                    progress_callback(batch_end, result.total_rows)
-
-            except Exception as e:
-                # Transaction was rolled back
-                # Count all rows in batch as failed
-                result.failed += len(batch)
-                for row_info in batch:
-                    result.errors.append(
-                        ImportError(
-                            row_num=row_info["row_num"],
-                            column="multiple",
-                            value="N/A",
-                            error_type="database",
-                            message=f"Batch failed: {str(e)}",
-                            severity="critical",
+                self._insert_batch(pending, fast=fast)
+                result.successful += len(pending)
+            except Exception:
+                # The batch transaction was rolled back; retry row by row so
+                # only the offending rows fail, each with its own error
+                for row_num, employee_data in pending:
+                    try:
+                        self._insert_batch([(row_num, employee_data)], fast=fast)
+                        result.successful += 1
+                    except Exception as e:
+                        result.failed += 1
+                        result.errors.append(
+                            ImportError(
+                                row_num=row_num,
+                                column="general",
+                                value=str(employee_data),
+                                error_type="database",
+                                message=str(e),
+                                severity="critical",
+                            )
                         )
-                    )
-                break
+
+            # Update progress
+            if progress_callback:
+                progress_callback(batch_end, result.total_rows)
 
         # Calculate duration
         result.duration = (datetime.now() - start_time).total_seconds()
 
-        # Close workbook
-        if self.workbook:
-            self.workbook.close()
-
         return result
 
-    def _import_single_row(self, row_info: Dict[str, Any]) -> Tuple[bool, Optional[ImportError]]:
+    def _prepare_row(
+        self, row_info: Dict[str, Any], seen_external_ids: set
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[ImportError]]:
         """
-        Import a single row of employee data.
+        Map and validate a single row of employee data.
 
         Args:
             row_info: Row dictionary from parse_file()
+            seen_external_ids: External IDs already accepted in this import
 
         Returns:
-            Tuple of (success, error_object)
+            Tuple of (employee_data, error_object); exactly one is None
         """
         row_num = row_info["row_num"]
         data = row_info["data"]
@@ -360,21 +516,34 @@ class ExcelImporter:
             # Validate data
             error = self._validate_row(row_num, employee_data)
             if error:
-                return False, error
+                return None, error
+
+            # Checks Employee.before_save() would run; rows are written
+            # without save(), so they must happen here
+            error = self._validate_model_fields(row_num, employee_data)
+            if error:
+                return None, error
 
             # Check for duplicate external_id
-            if employee_data.get("external_id"):
-                dup_error = self._check_duplicate_external_id(employee_data["external_id"])
+            external_id = employee_data.get("external_id")
+            if external_id:
+                if external_id in seen_external_ids:
+                    return None, ImportError(
+                        row_num=row_num,
+                        column="External ID",
+                        value=external_id,
+                        error_type="duplicate",
+                        message=f"External ID '{external_id}' appears more than once in the file",
+                    )
+                dup_error = self._check_duplicate_external_id(external_id)
                 if dup_error:
-                    return False, dup_error
+                    return None, dup_error
+                seen_external_ids.add(external_id)
 
-            # Create employee
-            employee = Employee.create(**employee_data)
-            print(f"[OK] Imported: {employee.full_name} (row {row_num})")
-            return True, None
+            return employee_data, None
 
         except Exception as e:
-            return False, ImportError(
+            return None, ImportError(
                 row_num=row_num,
                 column="general",
                 value=str(data),
@@ -383,6 +552,62 @@ class ExcelImporter:
                 severity="critical",
             )
 
+    def _validate_model_fields(self, row_num: int, employee_data: Dict[str, Any]) -> Optional[ImportError]:
+        """
+        Run the Employee model validators on a mapped row.
+
+        Args:
+            row_num: Row number (for error reporting)
+            employee_data: Mapped employee data, updated with validated values
+
+        Returns:
+            ImportError if invalid, None if valid
+        """
+        try:
+            validate_model_fields(employee_data)
+        except ModelValidationError as e:
+            return ImportError(
+                row_num=row_num,
+                column=e.field,
+                value=e.value,
+                error_type="validation",
+                message=e.message,
+            )
+
+        return None
+
+    def _insert_batch(self, pending: List[Tuple[int, Dict[str, Any]]], fast: bool = False) -> None:
+        """
+        Insert validated rows with a single INSERT inside one transaction.
+
+        Employee.save() is not called, so before_save() does not run.
+        _prepare_row() has already applied its checks: the external_id and
+        entry_date validators, and external_id uniqueness against the file
+        and the database. Field defaults (id, timestamps) are still applied
+        by insert_many().
+
+        Args:
+            pending: List of (row_num, employee_data) tuples
+            fast: Use raw_bulk_insert() instead of Employee.insert_many()
+
+        Raises:
+            Exception: Any database error; the whole batch is rolled back
+        """
+        if not pending:
+            return
+
+        # Rows were validated in _prepare_row(), so write plain dicts and
+        # never construct Employee instances
+        rows = [employee_data for _, employee_data in pending]
+        if fast:
+            raw_bulk_insert(rows)
+        else:
+            with database.atomic():
+                Employee.insert_many(rows).execute()
+
+        for row_num, employee_data in pending:
+            print(f"[OK] Imported: {employee_data['first_name']} {employee_data['last_name']} (row {row_num})")
+
     def _map_row_to_employee(self, row_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Map Excel row data to Employee model fields.
@@ -462,14 +687,21 @@ class ExcelImporter:
             ImportError if duplicate, None otherwise
         """
         try:
-            existing = Employee.select().where(Employee.external_id == external_id).first()
+            # Only the name is needed, so fetch a tuple rather than an Employee
+            existing = (
+                Employee.select(Employee.first_name, Employee.last_name)
+                .where(Employee.external_id == external_id)
+                .tuples()
+                .first()
+            )
             if existing:
+                first_name, last_name = existing
                 return ImportError(
                     row_num=0,  # Will be set by caller
                     column="External ID",
                     value=external_id,
                     error_type="duplicate",
-                    message=f"External ID '{external_id}' already exists (employee: {existing.full_name})",
+                    message=f"External ID '{external_id}' already exists (employee: {first_name} {last_name})",
                 )
         except Exception:
             pass
@@ -498,8 +730,8 @@ class ExcelImporter:
         if not value:
             return None
 
-        # Capitalize first letter
-        return value[0].upper() + value[1:].lower() if len(value) > 1 else value.upper()
+        # Capitalize first letter (one C-level call instead of slicing and concatenating)
+        return value.capitalize()
 
     @staticmethod
     def _parse_date(date_str: Optional[str]) -> Optional[date]:
@@ -522,11 +754,33 @@ class ExcelImporter:
         if not isinstance(date_str, str):
             date_str = str(date_str)
 
-        date_formats = ["%d/%m/%Y", "%Y-%m-%d"]
+        date_str = date_str.strip()
+
+        # Fast path: dispatch on separator positions for zero-padded dates,
+        # avoiding strptime and its exception on the format that doesn't match
+        if len(date_str) == 10:
+            if date_str[2] == "/" and date_str[5] == "/":
+                day, month, year = date_str[0:2], date_str[3:5], date_str[6:10]
+            elif date_str[4] == "-" and date_str[7] == "-":
+                year, month, day = date_str[0:4], date_str[5:7], date_str[8:10]
+            else:
+                return None
+
+            if not (day + month + year).isdigit():
+                return None
+
+            try:
+                return date(int(year), int(month), int(day))
+            except ValueError:
+                return None
+
+        # Unpadded forms such as 5/1/2025 still go through strptime
+        if "/" not in date_str and "-" not in date_str:
+            return None
 
-        for fmt in date_formats:
+        for fmt in DATE_FORMATS:
             try:
-                return datetime.strptime(date_str.strip(), fmt).date()
+                return datetime.strptime(date_str, fmt).date()
             except ValueError:
                 continue
 
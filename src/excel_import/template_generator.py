@@ -1,16 +1,24 @@
 """Excel template generator for employee import."""
 
+from itertools import cycle, islice
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 try:
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
     from openpyxl.utils import get_column_letter
     from openpyxl.worksheet.datavalidation import DataValidation
 except ImportError:
     raise ImportError("openpyxl is required for Excel template generation. Install it with: pip install openpyxl")
 
+# Optional fast writer for value-only sheets
+try:
+    import pyexcelerate
+except ImportError:
+    pyexcelerate = None
+
 from ui_ctk.constants import (
     ROLE_CARISTE,
     STATUS_ACTIVE,
@@ -36,9 +44,27 @@ class ExcelTemplateGenerator:
         "Entry Date",
     ]
 
+    # Columns that must be filled in, in COLUMNS order
+    REQUIRED_COLUMNS = ["First Name", "Last Name", "Status", "Workspace", "Role", "Contract", "Entry Date"]
+    REQUIRED_COLUMNS_SET = frozenset(REQUIRED_COLUMNS)
+
     # Status dropdown options
     STATUS_OPTIONS = [STATUS_ACTIVE, STATUS_INACTIVE]
 
+    # Sample data keys, in COLUMNS order
+    SAMPLE_FIELDS = [
+        "first_name",
+        "last_name",
+        "email",
+        "phone",
+        "external_id",
+        "status",
+        "workspace",
+        "role",
+        "contract_type",
+        "entry_date",
+    ]
+
     def generate_template(self, output_path: Path) -> None:
         """
         Generate Excel template file with instructions and validation.
@@ -219,10 +245,10 @@ class ExcelTemplateGenerator:
         # Select the data sheet
         workbook.active = sheet
 
-    @staticmethod
-    def _is_required_column(column_name: str) -> bool:
+    @classmethod
+    def _is_required_column(cls, column_name: str) -> bool:
         """Check if column is required."""
-        return column_name in ["First Name", "Last Name", "Status", "Workspace", "Role", "Contract", "Entry Date"]
+        return column_name in cls.REQUIRED_COLUMNS_SET
 
     def generate_sample_file(self, output_path: Path, num_employees: int = 5) -> None:
         """
@@ -237,61 +263,85 @@ class ExcelTemplateGenerator:
         role_choices = get_role_choices()
         contract_choices = get_contract_type_choices()
 
-        workbook = Workbook()
-        sheet = workbook.active
+        # Build all rows up front and write them in one pass
+        rows = self._generate_sample_rows(num_employees, workspace_choices, role_choices, contract_choices)
 
-        # Add headers
-        for col_idx, column_name in enumerate(self.COLUMNS, start=1):
-            cell = sheet.cell(row=1, column=col_idx)
-            cell.value = column_name
-            cell.font = Font(bold=True)
+        if pyexcelerate is not None:
+            self._write_sample_fast(output_path, rows)
+        else:
+            self._write_sample_openpyxl(output_path, rows)
 
-        # Add sample data with dynamic choices
-        sample_data = self._generate_sample_data(num_employees, workspace_choices, role_choices, contract_choices)
-        row_num = 2
-
-        for employee in sample_data:
-            sheet.cell(row_num, 1).value = employee["first_name"]
-            sheet.cell(row_num, 2).value = employee["last_name"]
-            sheet.cell(row_num, 3).value = employee["email"]
-            sheet.cell(row_num, 4).value = employee["phone"]
-            sheet.cell(row_num, 5).value = employee["external_id"]
-            sheet.cell(row_num, 6).value = employee["status"]
-            sheet.cell(row_num, 7).value = employee["workspace"]
-            sheet.cell(row_num, 8).value = employee["role"]
-            sheet.cell(row_num, 9).value = employee["contract_type"]
-            sheet.cell(row_num, 10).value = employee["entry_date"]
+        print(f"[OK] Sample file generated: {output_path} with {num_employees} employees")
 
-            row_num += 1
+    def _write_sample_fast(self, output_path: Path, rows: List[Tuple[str, ...]]) -> None:
+        """Write sample rows with pyexcelerate, which streams values without per-cell objects."""
+        workbook = pyexcelerate.Workbook()
+        sheet = workbook.new_sheet("Sheet", data=[self.COLUMNS, *rows])
+        sheet.set_row_style(1, pyexcelerate.Style(font=pyexcelerate.Font(bold=True)))
+        workbook.save(output_path)
+
+    def _write_sample_openpyxl(self, output_path: Path, rows: List[Tuple[str, ...]]) -> None:
+        """Write sample rows with openpyxl in write-only mode."""
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Sheet")
 
         # Auto-fit columns
-        for col_idx in range(1, 11):
-            col_letter = get_column_letter(col_idx)
-            sheet.column_dimensions[col_letter].auto_size = True
+        for col_idx in range(1, len(self.COLUMNS) + 1):
+            sheet.column_dimensions[get_column_letter(col_idx)].auto_size = True
+
+        header = []
+        for column_name in self.COLUMNS:
+            cell = WriteOnlyCell(sheet, value=column_name)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        sheet.append(header)
+
+        for row in rows:
+            sheet.append(row)
 
         workbook.save(output_path)
-        print(f"[OK] Sample file generated: {output_path} with {num_employees} employees")
 
     def _generate_sample_data(self, count: int, workspace_choices, role_choices, contract_choices) -> List[Dict[str, str]]:
         """Generate sample employee data for testing."""
+        rows = self._generate_sample_rows(count, workspace_choices, role_choices, contract_choices)
+        return [dict(zip(self.SAMPLE_FIELDS, row)) for row in rows]
+
+    def _generate_sample_rows(
+        self, count: int, workspace_choices, role_choices, contract_choices
+    ) -> List[Tuple[str, ...]]:
+        """Generate sample rows in SAMPLE_FIELDS order, one column at a time.
+
+        Raises:
+            ValueError: If rows are requested but a choice list is empty
+        """
+        if count > 0:
+            # cycle() over an empty list yields nothing, which would silently
+            # truncate every row to zip's shortest column
+            for label, choices in (
+                ("workspace", workspace_choices),
+                ("role", role_choices),
+                ("contract type", contract_choices),
+            ):
+                if not choices:
+                    raise ValueError(f"Cannot generate sample rows: no {label} choices configured")
+
         first_names = ["Jean", "Marie", "Pierre", "Sophie", "Thomas"]
         last_names = ["Dupont", "Martin", "Bernard", "Richard", "Petit"]
+        # Every 4th employee (starting with the first) is inactive
+        statuses = [STATUS_INACTIVE, STATUS_ACTIVE, STATUS_ACTIVE, STATUS_ACTIVE]
+
+        indexes = range(count)
+        columns = (
+            islice(cycle(first_names), count),
+            islice(cycle(last_names), count),
+            [f"employee{i + 1}@example.com" for i in indexes],
+            [f"06 12 34 5{i:02d}" for i in indexes],
+            [f"WMS-{i + 1:03d}" for i in indexes],
+            islice(cycle(statuses), count),
+            islice(cycle(workspace_choices), count),
+            islice(cycle(role_choices), count),
+            islice(cycle(contract_choices), count),
+            [f"{15 + i:02d}/01/2025" for i in indexes],
+        )
 
-        sample_data = []
-        for i in range(count):
-            sample_data.append(
-                {
-                    "first_name": first_names[i % len(first_names)],
-                    "last_name": last_names[i % len(last_names)],
-                    "email": f"employee{i + 1}@example.com",
-                    "phone": f"06 12 34 5{i:02d}",
-                    "external_id": f"WMS-{str(i + 1).zfill(3)}",
-                    "status": STATUS_ACTIVE if i % 4 != 0 else STATUS_INACTIVE,
-                    "workspace": workspace_choices[i % len(workspace_choices)],
-                    "role": role_choices[i % len(role_choices)],
-                    "contract_type": contract_choices[i % len(contract_choices)],
-                    "entry_date": f"{15 + i:02d}/01/2025",
-                }
-            )
-
-        return sample_data
+        return list(zip(*columns))
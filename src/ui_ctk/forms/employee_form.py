@@ -32,6 +32,9 @@ from ui_ctk.constants import (
 )
 from ui_ctk.forms.base_form import BaseFormDialog
 
+# Compiled once at import; validate_email() runs on every form validation
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
 
 class EmployeeFormDialog(BaseFormDialog):
     """
@@ -343,8 +346,7 @@ class EmployeeFormDialog(BaseFormDialog):
         Returns:
             True if valid, False otherwise
         """
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return re.match(pattern, email) is not None
+        return EMAIL_PATTERN.match(email) is not None
 
     def validate_phone(self, phone: str) -> bool:
         """
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import customtkinter as ctk
 
@@ -50,6 +50,9 @@ class EmployeeListView(BaseView):
         # State
         self.employees: List[Employee] = []
         self.filtered_employees: List[Employee] = []
+        # (employee, is_active, search_text) per employee, built once per load
+        self._filter_index: List[Tuple[Employee, bool, str]] = []
+        self._indexed_employees: Optional[List[Employee]] = None
         self.table_rows: List[ctk.CTkFrame] = []
 
         # Search and filter variables
@@ -153,6 +156,7 @@ class EmployeeListView(BaseView):
         """
         # Use optimized loading with prefetch
         self.employees = self.controller.get_employees_with_relations()
+        self._build_filter_index()
 
         # Apply filters
         self.apply_filters()
@@ -162,31 +166,55 @@ class EmployeeListView(BaseView):
 
         print(f"[INFO] Loaded {len(self.filtered_employees)} employees")
 
+    def _build_filter_index(self):
+        """Precompute status flags and search text for the loaded employees."""
+        self._filter_index = [(e, e.is_active, self._search_text(e)) for e in self.employees]
+        self._indexed_employees = self.employees
+
+    @staticmethod
+    def _search_text(employee: Employee) -> str:
+        """
+        Build the text matched by the search box for an employee.
+
+        Fields are joined with a separator that cannot be typed, so a
+        search term never matches across two fields.
+        """
+        return "\0".join(
+            (
+                employee.first_name.lower(),
+                employee.last_name.lower(),
+                employee.email.lower() if employee.email else "",
+                employee.phone or "",
+            )
+        )
+
     def apply_filters(self):
         """Apply search and filter to employee list."""
-        # Start with all employees
-        filtered = self.employees
+        # Index is built on load; rebuild it if the list was replaced since
+        if self._indexed_employees is not self.employees:
+            self._build_filter_index()
 
-        # Apply status filter
+        # Status filter: None keeps everyone
         filter_value = self.filter_var.get()
         if filter_value == STATUS_ACTIVE:
-            filtered = [e for e in filtered if e.is_active]
+            want_active = True
         elif filter_value == STATUS_INACTIVE:
-            filtered = [e for e in filtered if not e.is_active]
+            want_active = False
+        else:
+            want_active = None
 
-        # Apply search filter
         search_term = self.search_var.get().lower().strip()
-        if search_term:
-            filtered = [
-                e
-                for e in filtered
-                if search_term in e.first_name.lower()
-                or search_term in e.last_name.lower()
-                or (e.email and search_term in e.email.lower())
-                or (e.phone and search_term in e.phone)
-            ]
-
-        self.filtered_employees = filtered
+
+        if want_active is None and not search_term:
+            self.filtered_employees = self.employees
+            return
+
+        # Single pass over precomputed flags and lowercased search text
+        self.filtered_employees = [
+            e
+            for e, is_active, text in self._filter_index
+            if (want_active is None or is_active == want_active) and search_term in text
+        ]
 
     def refresh_table(self):
         """Rebuild table rows."""
@@ -2,7 +2,7 @@
 Backup Manager Module
 
 Provides automated database backup functionality with:
-- SQLite online backup API (safe, non-blocking)
+- SQLite VACUUM INTO / online backup API (safe, non-blocking)
 - Automatic cleanup of old backups
 - Backup validation
 - Restore functionality
@@ -68,16 +68,24 @@ class BackupManager:
 
         backup_path = self.backup_dir / backup_name
 
-        # Use SQLite backup API for safe backup
+        # VACUUM INTO writes a compacted, consistent copy in one statement
+        # (free pages are skipped); older SQLite falls back to the backup API
         try:
             source = sqlite3.connect(str(self.database_path))
-            dest = sqlite3.connect(str(backup_path))
-
-            # Backup with online backup API
-            source.backup(dest)
-
-            dest.close()
-            source.close()
+            try:
+                try:
+                    source.execute("VACUUM INTO ?", (str(backup_path),))
+                except sqlite3.OperationalError as e:
+                    logger.debug(f"VACUUM INTO unavailable, using backup API: {e}")
+                    if backup_path.exists():
+                        backup_path.unlink()
+                    dest = sqlite3.connect(str(backup_path))
+                    try:
+                        source.backup(dest)
+                    finally:
+                        dest.close()
+            finally:
+                source.close()
 
             logger.info(f"Backup created: {backup_path}")
 
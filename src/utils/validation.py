@@ -39,6 +39,9 @@ class InputValidator:
     # Character sets (simplified - \p{L} not supported in Python regex)
     # We'll validate using Unicode categories instead in the methods
     ALLOWED_EMAIL_CHARS = re.compile(r"^[a-zA-Z0-9._%+\-@]+$")
+    SUSPICIOUS_CONTENT = re.compile(r"<script|javascript:|onerror=|onload=", re.IGNORECASE)
+    PHONE_FORMATTING_CHARS = re.compile(r"[^\d+]")
+    EXTERNAL_ID_CHARS = re.compile(r"^[a-zA-Z0-9_\\-]+$")
     # Note: Phone validation is done in validate_phone() method, not with regex
 
     # Length limits
@@ -127,7 +130,7 @@ class InputValidator:
             raise ValidationError(field_name, "Must be string type", value)
 
         # Check for suspicious patterns FIRST (before sanitization)
-        if re.search(r'<script|javascript:|onerror=|onload=', value, re.IGNORECASE):
+        if InputValidator.SUSPICIOUS_CONTENT.search(value):
             raise ValidationError(field_name, "Contains suspicious content", value)
 
         # Length check BEFORE sanitization
@@ -215,7 +218,7 @@ class InputValidator:
         value = InputValidator.sanitize_string(value, InputValidator.MAX_LENGTH_PHONE)
 
         # Remove common formatting
-        digits_only = re.sub(r'[^\d+]', '', value)
+        digits_only = InputValidator.PHONE_FORMATTING_CHARS.sub('', value)
 
         # Length check (reasonable phone number length)
         if len(digits_only) < 10 or len(digits_only) > 15:
@@ -335,7 +338,7 @@ class InputValidator:
             raise ValidationError("external_id", "Cannot be empty")
 
         # Alphanumeric, underscore, hyphen only
-        if not re.match(r'^[a-zA-Z0-9_\\-]+$', value):
+        if not InputValidator.EXTERNAL_ID_CHARS.match(value):
             raise ValidationError("external_id", "Invalid format (alphanumeric, _, - only)", value)
 
         return value
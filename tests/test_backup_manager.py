@@ -126,6 +126,20 @@ class TestBackupCreation:
 
         assert original_data == backup_data
 
+    def test_create_backup_skips_free_pages(self, backup_manager, temp_database):
+        """Test that backup is compacted rather than a page-for-page copy."""
+        conn = sqlite3.connect(str(temp_database))
+        conn.execute("CREATE TABLE bulk (payload TEXT)")
+        conn.executemany("INSERT INTO bulk VALUES (?)", [("x" * 1000,)] * 500)
+        conn.commit()
+        conn.execute("DELETE FROM bulk")
+        conn.commit()
+        conn.close()
+
+        backup_path = backup_manager.create_backup()
+
+        assert backup_path.stat().st_size < temp_database.stat().st_size
+
     def test_create_backup_nonexistent_database(self):
         """Test creating backup when database doesn't exist."""
         # Use temp directory to ensure file doesn't exist
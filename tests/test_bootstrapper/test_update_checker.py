@@ -1,5 +1,7 @@
 """Tests for update checker module."""
 
+import json
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -10,11 +12,20 @@ from packaging.version import parse as parse_version
 from bootstrapper.update_checker import (
     UpdateChecker,
     check_for_updates,
+    get_http_session,
     get_update_info,
     is_update_available,
 )
 
 
+@pytest.fixture(autouse=True)
+def update_cache(tmp_path, monkeypatch):
+    """Point the release cache at a per-test file."""
+    cache_path = tmp_path / "update_cache.json"
+    monkeypatch.setattr(UpdateChecker, "CACHE_PATH", cache_path)
+    return cache_path
+
+
 class TestUpdateChecker:
     """Test suite for UpdateChecker class."""
 
@@ -42,6 +53,17 @@ class TestUpdateChecker:
             version = checker._get_current_version()
             assert version == "2.0.0"
 
+    def test_get_current_version_cached(self, monkeypatch):
+        """Test the current version is resolved once and reused."""
+        monkeypatch.setattr(UpdateChecker, "_cached_current_version", None)
+
+        first = UpdateChecker._get_current_version()
+        assert UpdateChecker._cached_current_version == first
+
+        monkeypatch.setattr(UpdateChecker, "_cached_current_version", "9.9.9")
+        assert UpdateChecker._get_current_version() == "9.9.9"
+        assert UpdateChecker().current_version == "9.9.9"
+
     def test_is_newer_version_true(self):
         """Test version comparison when newer."""
         checker = UpdateChecker(current_version="1.2.0")
@@ -65,6 +87,21 @@ class TestUpdateChecker:
         # Invalid versions should return False
         assert checker._is_newer_version("invalid") is False
 
+    def test_current_version_parsed_once(self):
+        """Test current version is parsed at init, not per comparison."""
+        checker = UpdateChecker(current_version="1.2.0")
+        assert checker._current_version_parsed == parse_version("1.2.0")
+
+        with patch('bootstrapper.update_checker.parse_version', wraps=parse_version) as mock_parse:
+            assert checker._is_newer_version("1.3.0") is True
+        mock_parse.assert_called_once_with("1.3.0")
+
+    def test_is_newer_version_invalid_current(self):
+        """Test an unparseable current version never reports an update."""
+        checker = UpdateChecker(current_version="unknown")
+        assert checker._current_version_parsed is None
+        assert checker._is_newer_version("1.3.0") is False
+
     def test_check_for_updates_newer_available(self):
         """Test check_for_updates with newer version available."""
         mock_release = {
@@ -76,7 +113,7 @@ class TestUpdateChecker:
             'author': {'login': 'test'},
         }
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_release
             mock_response.raise_for_status = MagicMock()
@@ -102,7 +139,7 @@ class TestUpdateChecker:
             'author': {'login': 'test'},
         }
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_release
             mock_response.raise_for_status = MagicMock()
@@ -123,7 +160,7 @@ class TestUpdateChecker:
             'author': {'login': 'test'},
         }
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_release
             mock_response.raise_for_status = MagicMock()
@@ -136,7 +173,7 @@ class TestUpdateChecker:
 
     def test_check_for_updates_request_error(self):
         """Test check_for_updates handles request errors gracefully."""
-        with patch('requests.get', side_effect=requests.RequestException("Network error")):
+        with patch('requests.Session.get', side_effect=requests.RequestException("Network error")):
             checker = UpdateChecker(current_version="1.2.0")
             result = checker.check_for_updates()
 
@@ -159,7 +196,7 @@ class TestUpdateChecker:
             'prerelease': False,
         }
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_release
             mock_response.raise_for_status = MagicMock()
@@ -183,7 +220,7 @@ class TestUpdateChecker:
             'prerelease': False,
         }
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_release
             mock_response.raise_for_status = MagicMock()
@@ -198,6 +235,120 @@ class TestUpdateChecker:
         assert info['update_info'] is None
 
 
+class TestReleaseCache:
+    """Test suite for the on-disk release cache."""
+
+    def _mock_response(self, release, status_code=200, etag='"abc"'):
+        mock_response = MagicMock()
+        mock_response.status_code = status_code
+        mock_response.headers = {'ETag': etag} if etag else {}
+        mock_response.json.return_value = release
+        mock_response.raise_for_status = MagicMock()
+        return mock_response
+
+    def _expire(self, update_cache):
+        cached = json.loads(update_cache.read_text())
+        cached['fetched_at'] -= UpdateChecker.CACHE_TTL
+        update_cache.write_text(json.dumps(cached))
+
+    def test_fresh_cache_skips_request(self):
+        """Test a second check within the TTL is served from the cache."""
+        release = {'tag_name': 'v1.3.0', 'prerelease': False}
+
+        with patch('requests.Session.get') as mock_get:
+            mock_get.return_value = self._mock_response(release)
+
+            checker = UpdateChecker(current_version="1.2.0")
+            first = checker.check_for_updates()
+            second = checker.check_for_updates()
+
+        assert mock_get.call_count == 1
+        assert first == second
+        assert second['version'] == "1.3.0"
+
+    def test_expired_cache_refetches(self, update_cache):
+        """Test an expired cache entry triggers a new request."""
+        release = {'tag_name': 'v1.3.0', 'prerelease': False}
+
+        with patch('requests.Session.get') as mock_get:
+            mock_get.return_value = self._mock_response(release)
+
+            checker = UpdateChecker(current_version="1.2.0")
+            checker.check_for_updates()
+            self._expire(update_cache)
+            checker.check_for_updates()
+
+        assert mock_get.call_count == 2
+
+    def test_expired_cache_sends_etag(self, update_cache):
+        """Test revalidation sends the stored ETag."""
+        release = {'tag_name': 'v1.3.0', 'prerelease': False}
+
+        with patch('requests.Session.get') as mock_get:
+            mock_get.return_value = self._mock_response(release, etag='"v1"')
+
+            checker = UpdateChecker(current_version="1.2.0")
+            checker.check_for_updates()
+            assert mock_get.call_args.kwargs['headers'] == {}
+
+            self._expire(update_cache)
+            checker.check_for_updates()
+
+        assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+
+    def test_not_modified_reuses_cached_release(self, update_cache):
+        """Test a 304 answer reuses the cached release and renews the entry."""
+        release = {'tag_name': 'v1.3.0', 'prerelease': False}
+
+        with patch('requests.Session.get') as mock_get:
+            mock_get.return_value = self._mock_response(release, etag='"v1"')
+            checker = UpdateChecker(current_version="1.2.0")
+            checker.check_for_updates()
+
+            self._expire(update_cache)
+            not_modified = self._mock_response(None, status_code=304, etag=None)
+            mock_get.return_value = not_modified
+            result = checker.check_for_updates()
+
+            # Renewed entry is fresh again
+            checker.check_for_updates()
+
+        not_modified.json.assert_not_called()
+        assert mock_get.call_count == 2
+        assert result['version'] == "1.3.0"
+        cached = json.loads(update_cache.read_text())
+        assert cached['etag'] == '"v1"'
+        assert time.time() - cached['fetched_at'] < UpdateChecker.CACHE_TTL
+
+    def test_cache_for_other_url_ignored(self, update_cache):
+        """Test a cache entry written for a different URL is not used."""
+        update_cache.write_text(json.dumps({
+            'fetched_at': time.time(),
+            'url': 'https://example.com/releases/latest',
+            'release': {'tag_name': 'v9.9.9', 'prerelease': False},
+        }))
+
+        with patch('requests.Session.get') as mock_get:
+            mock_get.return_value = self._mock_response({'tag_name': 'v1.2.0', 'prerelease': False})
+
+            result = UpdateChecker(current_version="1.2.0").check_for_updates()
+
+        assert mock_get.call_count == 1
+        assert result is None
+
+    def test_corrupt_cache_ignored(self, update_cache):
+        """Test an unreadable cache file falls back to the network."""
+        update_cache.write_text("not json")
+
+        with patch('requests.Session.get') as mock_get:
+            mock_get.return_value = self._mock_response({'tag_name': 'v1.3.0', 'prerelease': False})
+
+            result = UpdateChecker(current_version="1.2.0").check_for_updates()
+
+        assert mock_get.call_count == 1
+        assert result['version'] == "1.3.0"
+
+
 class TestConvenienceFunctions:
     """Test suite for convenience functions."""
 
@@ -210,7 +361,7 @@ class TestConvenienceFunctions:
             'prerelease': False,
         }
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_release
             mock_response.raise_for_status = MagicMock()
@@ -230,7 +381,7 @@ class TestConvenienceFunctions:
             'prerelease': False,
         }
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_release
             mock_response.raise_for_status = MagicMock()
@@ -248,7 +399,7 @@ class TestConvenienceFunctions:
             'prerelease': False,
         }
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_release
             mock_response.raise_for_status = MagicMock()
@@ -265,7 +416,7 @@ class TestConvenienceFunctions:
             'prerelease': False,
         }
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_release
             mock_response.raise_for_status = MagicMock()
@@ -282,7 +433,7 @@ class TestConvenienceFunctions:
             'prerelease': True,
         }
 
-        with patch('requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_response = MagicMock()
             mock_response.json.return_value = mock_release
             mock_response.raise_for_status = MagicMock()
@@ -291,3 +442,31 @@ class TestConvenienceFunctions:
             available = is_update_available(current_version="1.2.0")
 
         assert available is False  # Prerelease should be skipped
+
+
+class TestHttpSession:
+    """Test suite for the shared HTTP session."""
+
+    def test_session_is_shared(self, monkeypatch):
+        """Test one session is created and reused."""
+        monkeypatch.setattr('bootstrapper.update_checker._http_session', None)
+
+        session = get_http_session()
+        assert isinstance(session, requests.Session)
+        assert get_http_session() is session
+        assert session.headers['User-Agent'].startswith("wareflow-ems/")
+        assert session.get_adapter("https://api.github.com")._pool_maxsize == 4
+
+    def test_checks_use_shared_session(self):
+        """Test check_for_updates goes through the shared session."""
+        with patch('bootstrapper.update_checker.get_http_session') as mock_session:
+            mock_session.return_value.get.return_value.status_code = 200
+            mock_session.return_value.get.return_value.json.return_value = {
+                'tag_name': 'v1.3.0',
+                'prerelease': False,
+            }
+
+            result = check_for_updates(current_version="1.2.0")
+
+        assert result['version'] == "1.3.0"
+        mock_session.return_value.get.assert_called_once()
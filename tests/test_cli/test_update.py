@@ -0,0 +1,295 @@
+"""Tests for update command helpers."""
+
+import hashlib
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cli.update import (
+    DOWNLOAD_CHUNK_SIZE,
+    _prepare_update_info,
+    _trim_body,
+    checksum_algorithm,
+    copy_file,
+    create_backup,
+    download_file,
+    new_hasher,
+    pending_migrations,
+    restore_backup,
+    run_migrations,
+    verify_checksum,
+)
+
+
+@pytest.fixture
+def download(tmp_path):
+    """Create a fake downloaded archive larger than one read buffer."""
+    path = tmp_path / "update.zip"
+    path.write_bytes(b"wareflow" * 200_000)
+    return path
+
+
+class TestVerifyChecksum:
+    """Tests for verify_checksum."""
+
+    def test_matching_checksum(self, download):
+        """Should accept the file's SHA256 digest."""
+        expected = hashlib.sha256(download.read_bytes()).hexdigest()
+        assert verify_checksum(download, expected) is True
+
+    def test_matching_checksum_with_prefix(self, download):
+        """Should accept an upper-case digest with a sha256: prefix."""
+        expected = hashlib.sha256(download.read_bytes()).hexdigest()
+        assert verify_checksum(download, f"SHA256:{expected.upper()}") is True
+
+    def test_matching_checksum_with_whitespace(self, download):
+        """Should ignore surrounding whitespace, e.g. from a checksum file."""
+        expected = hashlib.sha256(download.read_bytes()).hexdigest()
+        assert verify_checksum(download, f"  sha256:{expected}\n") is True
+
+    def test_prefix_only_stripped_at_start(self, download):
+        """Should not strip the prefix from the middle of a checksum."""
+        expected = hashlib.sha256(download.read_bytes()).hexdigest()
+        assert verify_checksum(download, f"{expected[:32]}sha256:{expected[32:]}") is False
+
+    def test_mismatched_checksum(self, download):
+        """Should reject a different digest."""
+        assert verify_checksum(download, "0" * 64) is False
+
+    def test_no_expected_checksum(self, download):
+        """Should pass when no checksum is provided."""
+        assert verify_checksum(download) is True
+
+    def test_precomputed_checksum_skips_read(self, tmp_path):
+        """Should trust the precomputed digest without opening the file."""
+        missing = tmp_path / "missing.zip"
+        assert verify_checksum(missing, "abc", precomputed="abc") is True
+        assert verify_checksum(missing, "abc", precomputed="def") is False
+
+
+class TestChecksumAlgorithm:
+    """Tests for checksum algorithm selection."""
+
+    @pytest.mark.parametrize(
+        "expected,algorithm",
+        [
+            (None, "sha256"),
+            ("abc", "sha256"),
+            ("sha256:abc", "sha256"),
+            ("BLAKE3:abc", "blake3"),
+        ],
+    )
+    def test_checksum_algorithm(self, expected, algorithm):
+        """Should pick the algorithm from the checksum prefix."""
+        assert checksum_algorithm(expected) == algorithm
+
+    def test_blake3_without_package(self, download):
+        """Should refuse BLAKE3 checksums when blake3 is not installed."""
+        with patch('cli.update.blake3', None):
+            assert verify_checksum(download, "blake3:" + "0" * 64) is False
+            assert new_hasher("blake3:abc").name == "sha256"
+
+    def test_blake3_checksum(self, download):
+        """Should verify BLAKE3 checksums when blake3 is installed."""
+        blake3 = pytest.importorskip("blake3")
+        expected = blake3.blake3(download.read_bytes()).hexdigest()
+        assert verify_checksum(download, f"blake3:{expected}") is True
+        assert verify_checksum(download, "blake3:" + "0" * 64) is False
+
+
+class TestDownloadFile:
+    """Tests for download_file."""
+
+    @pytest.mark.parametrize("show_progress", [True, False])
+    def test_returns_digest_of_written_file(self, tmp_path, show_progress):
+        """Should hash the content while writing it."""
+        chunks = [b"a" * 1000, b"b" * 500, b"c"]
+        response = MagicMock()
+        response.headers = {'content-length': str(sum(map(len, chunks)))}
+        response.iter_content.return_value = chunks
+        response.content = b"".join(chunks)
+
+        dest = tmp_path / "update.zip"
+        with patch('requests.Session.get', return_value=response):
+            path, digest = download_file("https://example.com/update.zip", dest, show_progress)
+
+        assert path == dest
+        assert dest.read_bytes() == b"".join(chunks)
+        assert digest == hashlib.sha256(b"".join(chunks)).hexdigest()
+        if show_progress:
+            response.iter_content.assert_called_once_with(chunk_size=DOWNLOAD_CHUNK_SIZE)
+
+
+class TestTrimBody:
+    """Tests for release notes trimming."""
+
+    def test_skips_blank_lines(self):
+        """Should return only non-empty lines."""
+        assert _trim_body("## v1.3.0\n\n- Fix\r\n   \n- Feature") == ["## v1.3.0", "- Fix", "- Feature"]
+
+    def test_limits_line_count(self):
+        """Should stop after max_lines lines."""
+        body = "\n".join(f"line {i}" for i in range(1000))
+        assert _trim_body(body) == [f"line {i}" for i in range(10)]
+        assert _trim_body(body, max_lines=3) == ["line 0", "line 1", "line 2"]
+
+    def test_empty_body(self):
+        """Should return nothing for empty notes."""
+        assert _trim_body("") == []
+
+    def test_prepare_update_info(self):
+        """Should precompute the download URL and trimmed notes."""
+        update_info = {'tag_name': 'v1.3.0', 'body': "- Fix\n\n- Feature", 'version': '1.3.0'}
+
+        assert _prepare_update_info(update_info) is update_info
+        assert update_info['_download_url'] == \
+            "https://github.com/wareflowx/wareflow-ems/archive/refs/tags/v1.3.0.zip"
+        assert update_info['_trimmed_body'] == ["- Fix", "- Feature"]
+
+    def test_prepare_update_info_null_body(self):
+        """Should handle a release without notes."""
+        update_info = _prepare_update_info({'tag_name': 'v1.3.0', 'body': None})
+        assert update_info['_trimmed_body'] == []
+
+
+class TestBackup:
+    """Tests for database backup and restore."""
+
+    def test_copy_file(self, download, tmp_path):
+        """Should copy content whether or not reflinks are supported."""
+        dest = tmp_path / "copy.zip"
+        copy_file(download, dest)
+        assert dest.read_bytes() == download.read_bytes()
+
+    def test_copy_file_without_reflink(self, download, tmp_path):
+        """Should fall back to a regular copy when cloning fails."""
+        dest = tmp_path / "copy.zip"
+        dest.write_bytes(b"stale")
+        with patch('cli.update._reflink', return_value=False):
+            copy_file(download, dest)
+        assert dest.read_bytes() == download.read_bytes()
+
+    def test_backup_and_restore(self, tmp_path):
+        """Should restore the database content saved by create_backup."""
+        data_path = tmp_path / "employee_manager.db"
+        data_path.write_bytes(b"original")
+
+        backup_path = create_backup(data_path)
+        assert backup_path.parent == tmp_path / "backups"
+
+        data_path.write_bytes(b"migrated")
+        assert restore_backup(backup_path, data_path) is True
+        assert data_path.read_bytes() == b"original"
+
+    def test_backup_includes_wal_frames(self, tmp_path):
+        """Should capture committed rows still in the WAL of an open database."""
+        data_path = tmp_path / "employee_manager.db"
+        conn = sqlite3.connect(data_path)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA wal_autocheckpoint=0")
+            conn.execute("CREATE TABLE employees (name TEXT)")
+            conn.executemany("INSERT INTO employees VALUES (?)", [("Alice",), ("Bob",)])
+            conn.commit()
+
+            backup_path = create_backup(data_path)
+        finally:
+            conn.close()
+
+        backup = sqlite3.connect(backup_path)
+        try:
+            rows = backup.execute("SELECT name FROM employees ORDER BY name").fetchall()
+        finally:
+            backup.close()
+        assert rows == [("Alice",), ("Bob",)]
+
+    def test_backup_error_not_hidden_by_file_copy(self, tmp_path):
+        """Should raise instead of copying a SQLite database it cannot back up."""
+        data_path = tmp_path / "employee_manager.db"
+        sqlite3.connect(data_path).execute("CREATE TABLE t (x)").connection.close()
+
+        with patch('cli.update.sqlite_backup', side_effect=sqlite3.OperationalError("database is locked")), \
+                patch('cli.update.copy_file') as mock_copy:
+            with pytest.raises(sqlite3.OperationalError):
+                create_backup(data_path)
+        mock_copy.assert_not_called()
+
+    def test_backup_missing_database(self, tmp_path):
+        """Should skip the backup when there is no database."""
+        assert create_backup(tmp_path / "missing.db") is None
+
+
+class TestPendingMigrations:
+    """Tests for cached migration discovery."""
+
+    @pytest.fixture
+    def migrations_dir(self, tmp_path, monkeypatch):
+        """Create an empty migrations directory and reset the scan cache."""
+        monkeypatch.setattr('cli.update._last_scan', {})
+        path = tmp_path / "migrations"
+        path.mkdir()
+        return path
+
+    def _migration(self, name):
+        migration = MagicMock()
+        migration.name = name
+        return migration
+
+    def test_unchanged_directory_reuses_scan(self, migrations_dir):
+        """Should scan once and filter migrations applied since."""
+        first, second = self._migration("first"), self._migration("second")
+
+        with patch('database.migrations.base.get_pending_migrations', return_value=[first, second]) as mock_scan, \
+                patch('cli.update.get_applied_migrations', return_value={"first"}):
+            assert pending_migrations(migrations_dir) == [first, second]
+            assert pending_migrations(migrations_dir) == [second]
+
+        mock_scan.assert_called_once_with(migrations_dir)
+
+    def test_changed_directory_rescans(self, migrations_dir):
+        """Should scan again when a migration file is added."""
+        with patch('database.migrations.base.get_pending_migrations', return_value=[]) as mock_scan:
+            pending_migrations(migrations_dir)
+            (migrations_dir / "20260101_120000_new_migration.py").write_text("")
+            pending_migrations(migrations_dir)
+
+        assert mock_scan.call_count == 2
+
+
+class TestRunMigrations:
+    """Tests for run_migrations."""
+
+    def _migrations(self, *names):
+        migrations = []
+        for name in names:
+            migration = MagicMock()
+            migration.name = name
+            migrations.append(migration)
+        return migrations
+
+    def test_runs_all_pending(self):
+        """Should run every pending migration in one batch."""
+        migrations = self._migrations("first", "second", "third")
+
+        with patch('cli.update.pending_migrations', return_value=migrations), \
+                patch('cli.update.database') as mock_db, \
+                patch('database.migration_model.get_last_batch_number', return_value=2), \
+                patch('database.migrations.base.run_migration', return_value=True) as mock_run:
+            mock_db.is_closed.return_value = False
+            assert run_migrations() is True
+
+        assert [c.args for c in mock_run.call_args_list] == [(m, 3) for m in migrations]
+
+    def test_stops_on_failure(self):
+        """Should stop at the first failing migration."""
+        migrations = self._migrations("first", "second")
+
+        with patch('cli.update.pending_migrations', return_value=migrations), \
+                patch('cli.update.database') as mock_db, \
+                patch('database.migration_model.get_last_batch_number', return_value=0), \
+                patch('database.migrations.base.run_migration', return_value=False) as mock_run:
+            mock_db.is_closed.return_value = False
+            assert run_migrations() is False
+
+        mock_run.assert_called_once_with(migrations[0], 1)
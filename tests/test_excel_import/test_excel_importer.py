@@ -0,0 +1,132 @@
+"""Tests for the Excel importer's batch insert paths."""
+
+from datetime import date, datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from employee.models import Employee
+from employee.validators import ValidationError as ModelValidationError
+from excel_import.excel_importer import BULK_INSERT_PRAGMAS, ExcelImporter, raw_bulk_insert
+
+
+def make_row(row_num, external_id, first_name="Jean", entry_date="15/01/2020"):
+    """Build a parsed row as returned by ExcelImporter.parse_file()."""
+    data = {
+        "First Name": first_name,
+        "Last Name": "Dupont",
+        "External ID": external_id,
+        "Status": "Actif",
+        "Workspace": "Zone A",
+        "Role": "Cariste",
+        "Contract": "Intérim",
+        "Entry Date": entry_date,
+    }
+    return {"row_num": row_num, "data": data, "raw_row": data}
+
+
+def make_importer(rows):
+    """Create an importer with already parsed rows."""
+    importer = ExcelImporter(Path("unused.xlsx"))
+    importer.data_rows = rows
+    return importer
+
+
+@pytest.mark.parametrize("fast", [False, True])
+class TestImportEmployees:
+    """Test suite for ExcelImporter.import_employees()."""
+
+    def test_external_id_validated_like_save(self, db, fast):
+        """Test that rows get the external_id checks Employee.save() runs."""
+        importer = make_importer([make_row(2, "AB"), make_row(3, "WMS-001")])
+
+        result = importer.import_employees(fast=fast)
+
+        assert result.successful == 1
+        assert result.failed == 1
+        assert result.errors[0].row_num == 2
+        assert result.errors[0].column == "external_id"
+        assert Employee.select().where(Employee.external_id == "Ab").count() == 0
+
+    def test_future_entry_date_rejected(self, db, fast):
+        """Test that rows get the entry_date checks Employee.save() runs."""
+        importer = make_importer([make_row(2, "WMS-001", entry_date="01/01/2999")])
+
+        result = importer.import_employees(fast=fast)
+
+        assert result.successful == 0
+        assert result.errors[0].column == "entry_date"
+
+    def test_failed_batch_retried_row_by_row(self, db, fast):
+        """Test that one bad row in a batch does not fail the other rows."""
+        Employee.create(
+            first_name="Existing",
+            last_name="Employee",
+            external_id="Wms-002",
+            current_status="active",
+            workspace="Zone A",
+            role="Cariste",
+        )
+        rows = [make_row(2, "WMS-001"), make_row(3, "WMS-002"), make_row(4, "WMS-003")]
+        importer = make_importer(rows)
+
+        # Let the duplicate (stored capitalized, like the existing row) reach
+        # the database so the UNIQUE constraint fails
+        with patch.object(ExcelImporter, "_check_duplicate_external_id", return_value=None):
+            result = importer.import_employees(fast=fast)
+
+        assert result.successful == 2
+        assert result.failed == 1
+        assert [e.row_num for e in result.errors] == [3]
+        assert result.errors[0].error_type == "database"
+        assert Employee.select().count() == 3
+
+
+class TestRawBulkInsert:
+    """Test suite for raw_bulk_insert()."""
+
+    def make_data(self, external_id="WMS-001"):
+        """Build an employee field dictionary."""
+        return {
+            "first_name": "Jean",
+            "last_name": "Dupont",
+            "external_id": external_id,
+            "current_status": "active",
+            "workspace": "Zone A",
+            "role": "Cariste",
+            "contract_type": "CDI",
+            "entry_date": date(2020, 1, 15),
+        }
+
+    def test_rows_read_back_through_model(self, db):
+        """Test values are stored the way peewee would store them."""
+        assert raw_bulk_insert([self.make_data()]) == 1
+
+        employee = Employee.get(Employee.external_id == "WMS-001")
+        assert employee.entry_date == date(2020, 1, 15)
+        assert isinstance(employee.created_at, datetime)
+
+    def test_invalid_row_rejects_whole_insert(self, db):
+        """Test the model validators gate the raw insert."""
+        rows = [self.make_data(), self.make_data("../etc")]
+
+        with pytest.raises(ModelValidationError):
+            raw_bulk_insert(rows)
+
+        assert Employee.select().count() == 0
+
+    def test_connection_pragmas_restored(self, db):
+        """Test the bulk insert tuning does not leak into the connection."""
+        before = {
+            name: db.execute_sql(f"PRAGMA {name}").fetchone()[0]
+            for name in BULK_INSERT_PRAGMAS
+        }
+
+        raw_bulk_insert([self.make_data()])
+
+        after = {
+            name: db.execute_sql(f"PRAGMA {name}").fetchone()[0]
+            for name in BULK_INSERT_PRAGMAS
+        }
+        assert after == before
@@ -480,6 +480,19 @@ class TestExcelTemplateGenerator:
 
             wb.close()
 
+    def test_generate_sample_file_empty_choices(self):
+        """Test that empty config choices raise instead of writing short rows."""
+        generator = ExcelTemplateGenerator()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "sample.xlsx"
+
+            with patch("excel_import.template_generator.get_role_choices", return_value=[]):
+                with pytest.raises(ValueError, match="no role choices"):
+                    generator.generate_sample_file(output_path, num_employees=3)
+
+            assert not output_path.exists()
+
 
 class TestGenerateSampleData:
     """Test suite for _generate_sample_data method."""
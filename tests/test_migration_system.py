@@ -213,6 +213,260 @@ class TestMigrationManager(TestCase):
         backups_after = len(list(backup_manager.list_backups()))
         self.assertGreater(backups_after, backups_before)
 
+    def test_perform_migration_with_legacy_pre_check(self):
+        """Test migrations overriding pre_check(self) run through the manager."""
+        from database.migration_manager import MigrationManager
+        from database.migrations import BaseMigration
+
+        class LegacyMigration(BaseMigration):
+            def up(self):
+                pass
+
+            def down(self):
+                pass
+
+            @property
+            def name(self) -> str:
+                return "20250126_120000_legacy_migration"
+
+            def pre_check(self) -> bool:
+                return True
+
+        manager = MigrationManager(backup_manager=Mock())
+
+        # The manager records the migration again after run_migration() has;
+        # keep that second insert out of this test
+        with patch("database.migration_manager.validate_before_migration", return_value=(True, [])), \
+                patch("database.migration_manager.validate_after_migration", return_value=(True, [])), \
+                patch("database.migration_model.record_migration"):
+            success, message = manager._perform_migration([LegacyMigration()])
+
+        self.assertTrue(success, message)
+
+    def test_update_version_record_uses_given_batch(self):
+        """Test the applied batch is passed in rather than looked up again."""
+        from datetime import datetime
+
+        from database.migration_manager import MigrationManager
+        from database.migration_model import record_migration
+        from utils.backup_manager import BackupManager
+
+        record_migration("20250126_120000_test_migration_1", batch=1)
+        record_migration("20250126_120001_test_migration_2", batch=2)
+        old = datetime(2020, 1, 1)
+        self.Migration.update(applied_at=old).execute()
+
+        backup_manager = BackupManager(database_path=Path(self.db_path), backup_dir=Path(self.backup_dir))
+        manager = MigrationManager(backup_manager=backup_manager)
+
+        with patch("database.migration_manager.get_last_batch_number") as mock_last:
+            manager._update_version_record(1)
+        mock_last.assert_not_called()
+
+        applied = {m.batch: m.applied_at for m in self.Migration.select()}
+        self.assertGreater(applied[1], old)
+        self.assertEqual(applied[2], old)
+
+    def test_pending_migrations_cached_until_directory_changes(self):
+        """Test the migrations directory is scanned once while unchanged."""
+        import shutil
+
+        import database.migration_manager as migration_manager
+        from utils.backup_manager import BackupManager
+
+        migrations_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, migrations_dir)
+
+        backup_manager = BackupManager(database_path=Path(self.db_path), backup_dir=Path(self.backup_dir))
+        manager = migration_manager.MigrationManager(backup_manager=backup_manager)
+        manager.migrations_dir = migrations_dir
+
+        with patch.dict(migration_manager._migration_state_cache, clear=True), \
+                patch("database.migration_manager.get_pending_migrations", return_value=[]) as mock_scan:
+            manager._get_pending_migrations()
+            manager.get_migration_plan()
+            self.assertEqual(mock_scan.call_count, 1)
+
+            # A new migration file changes the directory mtime
+            os.utime(migrations_dir, ns=(0, 0))
+            manager._get_pending_migrations()
+            self.assertEqual(mock_scan.call_count, 2)
+
+    def test_cached_pending_migrations_drop_applied(self):
+        """Test migrations applied after the scan are not reported as pending."""
+        import shutil
+
+        import database.migration_manager as migration_manager
+        from database.migration_model import record_migration
+        from utils.backup_manager import BackupManager
+
+        migrations_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, migrations_dir)
+
+        backup_manager = BackupManager(database_path=Path(self.db_path), backup_dir=Path(self.backup_dir))
+        manager = migration_manager.MigrationManager(backup_manager=backup_manager)
+        manager.migrations_dir = migrations_dir
+
+        first = Mock()
+        first.name = "20250126_120000_test_migration_1"
+        second = Mock()
+        second.name = "20250126_120001_test_migration_2"
+
+        with patch.dict(migration_manager._migration_state_cache, clear=True), \
+                patch("database.migration_manager.get_pending_migrations", return_value=[first, second]):
+            self.assertEqual(manager._get_pending_migrations(), [first, second])
+
+            # A run that applied the first migration, then failed
+            record_migration(first.name, batch=1)
+            self.assertEqual(manager._get_pending_migrations(), [second])
+
+    def test_logging_configured_once_by_first_manager(self):
+        """Test logging is set up on first use rather than at import."""
+        import database.migration_manager as migration_manager
+        import database.migrations.base as migrations_base
+        from utils.backup_manager import BackupManager
+
+        backup_manager = BackupManager(database_path=Path(self.db_path), backup_dir=Path(self.backup_dir))
+
+        with patch.object(migrations_base, "_logging_file_enabled", None), \
+                patch("database.migrations.base.setup_logging") as mock_setup:
+            migration_manager.MigrationManager(backup_manager=backup_manager)
+            migration_manager.MigrationManager(backup_manager=backup_manager)
+
+        mock_setup.assert_called_once_with(level="INFO", enable_console=True, enable_file=True)
+
+    def test_manager_enables_file_logging_after_framework_use(self):
+        """Test a console-only setup from the framework is upgraded by the manager."""
+        import database.migration_manager as migration_manager
+        import database.migrations.base as migrations_base
+        from utils.backup_manager import BackupManager
+
+        backup_manager = BackupManager(database_path=Path(self.db_path), backup_dir=Path(self.backup_dir))
+
+        with patch.object(migrations_base, "_logging_file_enabled", None), \
+                patch("database.migrations.base.setup_logging") as mock_setup:
+            migrations_base.discover_migrations(Path(self.backup_dir))
+            migration_manager.MigrationManager(backup_manager=backup_manager)
+            migrations_base.discover_migrations(Path(self.backup_dir))
+
+        self.assertEqual(
+            [call.kwargs["enable_file"] for call in mock_setup.call_args_list], [False, True]
+        )
+
+    def test_pending_migrations_stamp_skips_scan_across_processes(self):
+        """Test the stamp stored in the database skips the directory scan."""
+        import shutil
+
+        import database.migration_manager as migration_manager
+        from database.connection import database
+        from database.migration_model import record_migration
+        from utils.backup_manager import BackupManager
+
+        migrations_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, migrations_dir)
+
+        backup_manager = BackupManager(database_path=Path(self.db_path), backup_dir=Path(self.backup_dir))
+        manager = migration_manager.MigrationManager(backup_manager=backup_manager)
+        manager.migrations_dir = migrations_dir
+
+        with patch.dict(migration_manager._migration_state_cache, clear=True), \
+                patch("database.migration_manager.get_pending_migrations", return_value=[]) as mock_scan:
+            manager._get_pending_migrations()
+            manager._update_version_record()
+            self.assertEqual(mock_scan.call_count, 1)
+
+            # A fresh process has an empty in-memory cache
+            migration_manager._migration_state_cache.clear()
+            self.assertEqual(manager._get_pending_migrations(), [])
+            self.assertEqual(mock_scan.call_count, 1)
+
+            # A change to the applied migrations invalidates the stamp
+            migration_manager._migration_state_cache.clear()
+            record_migration("20250126_120000_test_migration_1", batch=1)
+            manager._get_pending_migrations()
+            self.assertEqual(mock_scan.call_count, 2)
+
+        # The stamp lives in its own table, leaving the database header alone
+        self.assertEqual(database.execute_sql("PRAGMA user_version").fetchone()[0], 0)
+
+    def test_pending_migrations_stamp_not_stored_after_load_failure(self):
+        """Test a migration that failed to load keeps later runs scanning."""
+        import shutil
+
+        import database.migration_manager as migration_manager
+        from utils.backup_manager import BackupManager
+
+        migrations_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, migrations_dir)
+
+        backup_manager = BackupManager(database_path=Path(self.db_path), backup_dir=Path(self.backup_dir))
+        manager = migration_manager.MigrationManager(backup_manager=backup_manager)
+        manager.migrations_dir = migrations_dir
+
+        def scan_with_broken_migration(migrations_dir, failed):
+            failed.append("20250126_120000_broken_migration")
+            return []
+
+        with patch.dict(migration_manager._migration_state_cache, clear=True), \
+                patch("database.migration_manager.get_pending_migrations",
+                      side_effect=scan_with_broken_migration) as mock_scan:
+            manager.get_migration_plan()
+            manager._update_version_record()
+            self.assertIsNone(migration_manager._read_migrations_stamp())
+
+            # The next process scans again and retries the broken migration
+            migration_manager._migration_state_cache.clear()
+            manager._get_pending_migrations()
+            self.assertEqual(mock_scan.call_count, 2)
+
+    def test_migration_plan_does_not_store_stamp(self):
+        """Test previewing the migration plan leaves the database untouched."""
+        import shutil
+
+        import database.migration_manager as migration_manager
+        from utils.backup_manager import BackupManager
+
+        migrations_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, migrations_dir)
+
+        backup_manager = BackupManager(database_path=Path(self.db_path), backup_dir=Path(self.backup_dir))
+        manager = migration_manager.MigrationManager(backup_manager=backup_manager)
+        manager.migrations_dir = migrations_dir
+
+        with patch.dict(migration_manager._migration_state_cache, clear=True), \
+                patch("database.migration_manager.get_pending_migrations", return_value=[]):
+            manager.get_migration_plan()
+
+        self.assertIsNone(migration_manager._read_migrations_stamp())
+
+    def test_pending_migrations_stamp_without_state_table(self):
+        """Test a database without the migration_state table is scanned normally."""
+        import shutil
+
+        import database.migration_manager as migration_manager
+        from database.connection import database
+        from database.migration_model import MigrationState
+        from utils.backup_manager import BackupManager
+
+        migrations_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, migrations_dir)
+
+        backup_manager = BackupManager(database_path=Path(self.db_path), backup_dir=Path(self.backup_dir))
+        manager = migration_manager.MigrationManager(backup_manager=backup_manager)
+        manager.migrations_dir = migrations_dir
+        database.drop_tables([MigrationState], safe=True)
+
+        with patch.dict(migration_manager._migration_state_cache, clear=True), \
+                patch("database.migration_manager.get_pending_migrations", return_value=[]) as mock_scan:
+            self.assertEqual(manager._get_pending_migrations(), [])
+            self.assertEqual(mock_scan.call_count, 1)
+            self.assertFalse(MigrationState.table_exists())
+
+            # Storing the stamp creates the table
+            manager._update_version_record()
+
+        self.assertTrue(MigrationState.table_exists())
+
 
 class TestMigrationValidation(TestCase):
     """Test migration validation system."""
@@ -308,6 +562,169 @@ class TestMigrationValidation(TestCase):
         self.assertNotIn("20250126_120000_test_migration", applied)
 
 
+class TestDatabaseWritableCheck(TestCase):
+    """Test the database writability pre-check."""
+
+    def setUp(self):
+        """Set up test database."""
+        from database.connection import database
+
+        self.db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        database.init(self.db_path)
+        database.connect()
+        database.execute_sql("CREATE TABLE existing (name TEXT)")
+
+    def tearDown(self):
+        """Clean up test database."""
+        from database.connection import database
+
+        database.close()
+        os.close(self.db_fd)
+        os.unlink(self.db_path)
+
+    def test_writable_database_leaves_no_trace(self):
+        """Test the check passes without committing its probe table."""
+        from database.connection import database
+        from database.migration_validation import check_database_writable
+
+        check_database_writable()
+
+        self.assertFalse(database.in_transaction())
+        self.assertNotIn("_migration_test_write", database.get_tables())
+
+    def test_read_only_database_fails(self):
+        """Test the check fails on a read-only connection."""
+        from database.connection import database
+        from database.migration_validation import MigrationValidationError, check_database_writable
+
+        database.close()
+        database.init(f"file:{self.db_path}?mode=ro", uri=True)
+        database.connect()
+
+        with self.assertRaises(MigrationValidationError) as ctx:
+            check_database_writable()
+        self.assertEqual(ctx.exception.check_name, "database_writable")
+
+
+class TestBatchedPreChecks(TestCase):
+    """Test running pre-migration checks in one transaction."""
+
+    def setUp(self):
+        """Set up test database."""
+        from database.connection import database
+
+        self.db_fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        database.init(self.db_path)
+        database.connect()
+
+    def tearDown(self):
+        """Clean up test database."""
+        from database.connection import database
+
+        database.close()
+        os.close(self.db_fd)
+        os.unlink(self.db_path)
+
+    def test_default_checks_pass_and_commit_once(self):
+        """Test the default checks pass and only their intended changes persist."""
+        from database.connection import database
+        from database.migration_validation import validate_before_migration
+
+        success, errors = validate_before_migration()
+
+        self.assertTrue(success, errors)
+        self.assertFalse(database.in_transaction())
+        tables = database.get_tables()
+        self.assertIn("app_version", tables)
+        self.assertNotIn("_migration_test_write", tables)
+
+    def test_checks_share_one_transaction(self):
+        """Test every check runs inside the same outer transaction."""
+        from database.connection import database
+        from database.migration_validation import MigrationValidator
+
+        seen = []
+        validator = MigrationValidator()
+        validator.add_pre_check(lambda: seen.append(database.in_transaction()))
+        validator.add_pre_check(lambda: seen.append(database.in_transaction()))
+
+        success, errors = validator.run_pre_checks_batched()
+
+        self.assertTrue(success)
+        self.assertEqual(seen, [True, True])
+        self.assertFalse(database.in_transaction())
+
+    def test_failed_check_reported(self):
+        """Test a failing check is reported like in run_pre_checks."""
+        from database.migration_validation import MigrationValidationError, MigrationValidator
+
+        def failing_check():
+            raise MigrationValidationError("boom", check_name="failing")
+
+        validator = MigrationValidator()
+        validator.add_pre_check(failing_check)
+
+        success, errors = validator.run_pre_checks_batched()
+
+        self.assertFalse(success)
+        self.assertEqual(errors, ["Pre-check failed (failing): boom"])
+
+
+class TestIoBoundPreChecks(TestCase):
+    """Test running I/O-bound pre-checks alongside database checks."""
+
+    def test_io_bound_check_runs_in_worker_thread(self):
+        """Test @io_bound checks leave the calling thread for database checks."""
+        import threading
+
+        from database.migration_validation import MigrationValidator, io_bound
+
+        threads = {}
+
+        @io_bound
+        def disk_check():
+            threads["io"] = threading.get_ident()
+
+        def db_check():
+            threads["db"] = threading.get_ident()
+
+        validator = MigrationValidator()
+        validator.add_pre_check(disk_check)
+        validator.add_pre_check(db_check)
+
+        success, errors = validator.run_pre_checks()
+
+        self.assertTrue(success, errors)
+        self.assertEqual(threads["db"], threading.get_ident())
+        self.assertNotEqual(threads["io"], threading.get_ident())
+
+    def test_errors_reported_in_registration_order(self):
+        """Test errors keep the order the checks were added in."""
+        from database.migration_validation import (
+            MigrationValidationError,
+            MigrationValidator,
+            io_bound,
+        )
+
+        def first_check():
+            raise MigrationValidationError("db failed", check_name="first")
+
+        @io_bound
+        def second_check():
+            raise MigrationValidationError("disk failed", check_name="second")
+
+        validator = MigrationValidator()
+        validator.add_pre_check(first_check)
+        validator.add_pre_check(second_check)
+
+        success, errors = validator.run_pre_checks()
+
+        self.assertFalse(success)
+        self.assertEqual(len(errors), 2)
+        self.assertIn("first", errors[0])
+        self.assertIn("second", errors[1])
+
+
 if __name__ == "__main__":
     import unittest
 
@@ -20,6 +20,7 @@ from database.migrations.base import (
     RollbackError,
     backup_database,
     discover_migrations,
+    get_existing_tables,
     get_pending_migrations,
     restore_database,
     rollback_migration,
@@ -316,6 +317,20 @@ class Migration(BaseMigration):
         # Should return empty list when import fails
         assert pending == []
 
+    def test_migration_classes_reused_between_calls(self, test_db):
+        """Test that a second scan reuses the migration classes already loaded."""
+        import database.migrations as migrations_package
+
+        migrations_dir = Path(migrations_package.__file__).parent
+
+        first = get_pending_migrations(migrations_dir)
+        with patch("importlib.import_module") as mock_import:
+            second = get_pending_migrations(migrations_dir)
+
+        mock_import.assert_not_called()
+        assert first
+        assert [type(m) for m in second] == [type(m) for m in first]
+
 
 class TestRunMigration:
     """Test suite for running migrations."""
@@ -403,6 +418,51 @@ class TestRunMigration:
         with pytest.raises(MigrationError):
             run_migration(migration, batch=1)
 
+    def test_run_migration_passes_existing_tables(self, test_db):
+        """Test that a pre-scanned table set reaches pre_check."""
+        seen = []
+
+        class TestMigration(BaseMigration):
+            def up(self):
+                pass
+
+            def down(self):
+                pass
+
+            @property
+            def name(self) -> str:
+                return "20250123_120000_test_migration"
+
+            def pre_check(self, existing_tables=None) -> bool:
+                seen.append(existing_tables)
+                return True
+
+        run_migration(TestMigration(), batch=1, existing_tables={"migrations"})
+
+        assert seen == [{"migrations"}]
+
+    def test_run_migration_legacy_pre_check_with_existing_tables(self, test_db):
+        """Test that a pre_check(self) override still works when a set is given."""
+        class TestMigration(BaseMigration):
+            def up(self):
+                pass
+
+            def down(self):
+                pass
+
+            @property
+            def name(self) -> str:
+                return "20250123_120000_test_migration"
+
+            def pre_check(self) -> bool:
+                return True
+
+        assert run_migration(TestMigration(), batch=1, existing_tables={"migrations"}) is True
+
+    def test_get_existing_tables(self, test_db):
+        """Test that the table scan returns the tables in the database."""
+        assert "migrations" in get_existing_tables()
+
 
 class TestRollbackMigration:
     """Test suite for rolling back migrations."""
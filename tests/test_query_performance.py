@@ -156,6 +156,21 @@ class TestNPlusOneQueryFix:
         assert isinstance(visits, list)
         assert isinstance(trainings, list)
 
+    def test_active_employees_with_relations(self, db, sample_employee, inactive_employee):
+        """Test that active employees are loaded with relations preloaded."""
+        controller = EmployeeController()
+
+        employees = controller.get_active_employees_with_relations()
+
+        assert sample_employee in employees
+        assert inactive_employee not in employees
+
+        # Prefetched backrefs are plain lists, so rendering needs no extra queries
+        emp = next(e for e in employees if e.id == sample_employee.id)
+        assert isinstance(emp.caces, list)
+        assert isinstance(emp.medical_visits, list)
+        assert isinstance(emp.trainings, list)
+
 
 class TestQueryEfficiency:
     """Test query efficiency improvements."""